@@ -42,10 +42,14 @@ def send_simple_transaction():
 
         # Print commission details
         print("\n💰 Commission Distribution:")
-        for comm in result.commissions:
+        if result.commissions:
             print(
-                f"  Level {comm.level}: Associate {comm.associate_id} - "
-                f"${comm.amount / 100:.2f} ({comm.percentage}%)"
+                *(
+                    f"  Level {comm.level}: Associate {comm.associate_id} - "
+                    f"${comm.amount / 100:.2f} ({comm.percentage}%)"
+                    for comm in result.commissions
+                ),
+                sep="\n",
             )
 
     except HAVNAuthError as e:
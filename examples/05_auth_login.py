@@ -25,6 +25,7 @@ client = HAVNClient(
     api_key=os.getenv("HAVN_API_KEY"),
     webhook_secret=os.getenv("HAVN_WEBHOOK_SECRET"),
     base_url=os.getenv("HAVN_BASE_URL", "https://api.havn.com"),
+    prewarm=True,  # Warm the TLS connection so the first login is fast
 )
 
 
@@ -6,7 +6,7 @@ custom configuration, and batch operations.
 """
 
 from havn import HAVNClient
-from havn.exceptions import HAVNAPIError
+from havn.exceptions import HAVNAPIError, HAVNError
 
 
 def use_context_manager():
@@ -51,7 +51,7 @@ def custom_configuration():
 
 
 def batch_transactions():
-    """Send multiple transactions (simulated batch)"""
+    """Send multiple transactions concurrently"""
     print("=== Batch Transactions ===\n")
 
     client = HAVNClient()
@@ -81,20 +81,25 @@ def batch_transactions():
         },
     ]
 
-    results = []
-    for i, txn in enumerate(transactions, 1):
-        try:
-            result = client.transactions.send(**txn)
-            results.append(result)
-            print(
-                f"✅ Transaction {i}/{len(transactions)}: "
-                f"${result.transaction.amount / 100:.2f} - "
-                f"{result.transaction.transaction_id}"
-            )
-        except HAVNAPIError as e:
-            print(f"❌ Transaction {i} failed: {e}")
-
-    print(f"\n✅ Batch complete: {len(results)}/{len(transactions)} successful")
+    # Transactions are sent concurrently over the client's pooled connections
+    results = client.transactions.send_many(transactions)
+
+    # Collect report lines and write them once instead of one print per row
+    lines = []
+    successful = 0
+    for i, result in enumerate(results, 1):
+        if isinstance(result, HAVNError):
+            lines.append(f"❌ Transaction {i} failed: {result}")
+            continue
+        successful += 1
+        lines.append(
+            f"✅ Transaction {i}/{len(transactions)}: "
+            f"${result.transaction.amount / 100:.2f} - "
+            f"{result.transaction.transaction_id}"
+        )
+
+    lines.append(f"\n✅ Batch complete: {successful}/{len(transactions)} successful")
+    print(*lines, sep="\n")
 
 
 def use_environment_variables():
@@ -2,66 +2,95 @@
 HAVN Python SDK
 
 Official Python SDK for integrating with HAVN API.
+
+Public names are imported lazily (PEP 562) so `import havn` stays cheap;
+`requests`/`urllib3` are only loaded once `HAVNClient` (or another name that
+needs them) is first accessed.
 """
 
-from .client import HAVNClient
-from .exceptions import (
-    HAVNError,
-    HAVNAPIError,
-    HAVNAuthError,
-    HAVNValidationError,
-    HAVNNetworkError,
-    HAVNRateLimitError,
-)
-from .models import (
-    TransactionPayload,
-    TransactionResponse,
-    UserSyncPayload,
-    UserSyncResponse,
-    BulkUserSyncPayload,
-    BulkUserSyncResponse,
-    BulkSyncSummary,
-    VoucherValidationPayload,
-    VoucherListFilters,
-    VoucherData,
-    VoucherListPagination,
-    VoucherListResponse,
-    is_havn_voucher_code,
-)
-from .utils.currency import (
-    CurrencyConverter,
-    convert_to_usd_cents,
-    convert_from_usd_cents,
-    get_exchange_rate,
-)
+import importlib
+from typing import TYPE_CHECKING
 
 __version__ = "1.3.0"
 __author__ = "Bagus"
 __email__ = "bagus@intelove.com"
 
-__all__ = [
-    "HAVNClient",
-    "HAVNError",
-    "HAVNAPIError",
-    "HAVNAuthError",
-    "HAVNValidationError",
-    "HAVNNetworkError",
-    "HAVNRateLimitError",
-    "TransactionPayload",
-    "TransactionResponse",
-    "UserSyncPayload",
-    "UserSyncResponse",
-    "BulkUserSyncPayload",
-    "BulkUserSyncResponse",
-    "BulkSyncSummary",
-    "VoucherValidationPayload",
-    "VoucherListFilters",
-    "VoucherData",
-    "VoucherListPagination",
-    "VoucherListResponse",
-    "is_havn_voucher_code",
-    "CurrencyConverter",
-    "convert_to_usd_cents",
-    "convert_from_usd_cents",
-    "get_exchange_rate",
-]
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "HAVNClient": ".client",
+    "HAVNAsyncClient": ".async_client",
+    "HAVNError": ".exceptions",
+    "HAVNAPIError": ".exceptions",
+    "HAVNAuthError": ".exceptions",
+    "HAVNValidationError": ".exceptions",
+    "HAVNNetworkError": ".exceptions",
+    "HAVNRateLimitError": ".exceptions",
+    "TransactionPayload": ".models",
+    "TransactionResponse": ".models",
+    "UserSyncPayload": ".models",
+    "UserSyncResponse": ".models",
+    "BulkUserSyncPayload": ".models",
+    "BulkUserSyncResponse": ".models",
+    "BulkSyncSummary": ".models",
+    "VoucherValidationPayload": ".models",
+    "VoucherListFilters": ".models",
+    "VoucherData": ".models",
+    "VoucherListPagination": ".models",
+    "VoucherListResponse": ".models",
+    "is_havn_voucher_code": ".models",
+    "CurrencyConverter": ".utils.currency",
+    "convert_to_usd_cents": ".utils.currency",
+    "convert_from_usd_cents": ".utils.currency",
+    "get_exchange_rate": ".utils.currency",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis / IDE completion only
+    from .client import HAVNClient
+    from .async_client import HAVNAsyncClient
+    from .exceptions import (
+        HAVNError,
+        HAVNAPIError,
+        HAVNAuthError,
+        HAVNValidationError,
+        HAVNNetworkError,
+        HAVNRateLimitError,
+    )
+    from .models import (
+        TransactionPayload,
+        TransactionResponse,
+        UserSyncPayload,
+        UserSyncResponse,
+        BulkUserSyncPayload,
+        BulkUserSyncResponse,
+        BulkSyncSummary,
+        VoucherValidationPayload,
+        VoucherListFilters,
+        VoucherData,
+        VoucherListPagination,
+        VoucherListResponse,
+        is_havn_voucher_code,
+    )
+    from .utils.currency import (
+        CurrencyConverter,
+        convert_to_usd_cents,
+        convert_from_usd_cents,
+        get_exchange_rate,
+    )
+
+
+def __getattr__(name):
+    """Import public names on first access (PEP 562)"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,110 @@
+"""
+Asyncio client for HAVN API interactions
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from .client import HAVNClient
+from .config import Config
+
+
+class _AsyncHandler:
+    """
+    Awaitable view over a sync webhook handler
+
+    Public methods of the wrapped handler (e.g., `send`, `validate`, `login`)
+    become coroutines that run on the client's worker pool.
+    """
+
+    def __init__(self, async_client: "HAVNAsyncClient", handler: Any):
+        self._async_client = async_client
+        self._handler = handler
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._handler, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        async def method(*args, **kwargs):
+            return await self._async_client._run(attr, *args, **kwargs)
+
+        return method
+
+
+class HAVNAsyncClient:
+    """
+    Asyncio HAVN API client
+
+    Wraps `HAVNClient` so every handler method can be awaited. Calls run on a
+    bounded thread pool and share the wrapped client's keep-alive connection
+    pool, HMAC key, rate limiter and caches, so behavior (signing, retries,
+    errors) is identical to the sync client. No extra HTTP dependency needed.
+
+    Example:
+        >>> async with HAVNAsyncClient(api_key="...", webhook_secret="...") as client:
+        ...     results = await asyncio.gather(
+        ...         *(client.transactions.send(**tx) for tx in batch),
+        ...         return_exceptions=True,
+        ...     )
+    """
+
+    def __init__(self, *args, max_concurrency: int = 32, **kwargs):
+        """
+        Initialize async client
+
+        Args:
+            *args: Positional arguments for `HAVNClient`
+            max_concurrency: Maximum requests in flight at once (default: 32)
+            **kwargs: Keyword arguments for `HAVNClient` (api_key, webhook_secret, ...)
+
+        Raises:
+            ValueError: If api_key or webhook_secret is not provided and not in environment
+        """
+        # Keep enough pooled connections for every concurrent worker, without
+        # shrinking a larger pool configured via HAVN_POOL_MAXSIZE
+        kwargs.setdefault(
+            "pool_maxsize", max(max_concurrency, Config.get_client_env().pool_maxsize)
+        )
+        self.client = HAVNClient(*args, **kwargs)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="havn-async"
+        )
+
+        self.transactions = _AsyncHandler(self, self.client.transactions)
+        self.vouchers = _AsyncHandler(self, self.client.vouchers)
+        self.auth = _AsyncHandler(self, self.client.auth)
+
+    async def _run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking call on the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs)
+        )
+
+    async def close(self):
+        """Wait for in-flight calls, then close the HTTP session"""
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+        self.client.close()
+
+    async def __aenter__(self):
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit"""
+        await self.close()
+        return False
+
+    def __repr__(self):
+        """String representation"""
+        return (
+            f"HAVNAsyncClient(base_url='{self.client.base_url}', "
+            f"max_concurrency={self.max_concurrency})"
+        )
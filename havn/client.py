@@ -2,98 +2,119 @@
 Main HAVN client for API interactions
 """
 
+import functools
+import threading
 import time
-import json
-from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, List, Mapping, Tuple, Union
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from .config import Config
 from .exceptions import (
     HAVNAPIError,
     HAVNAuthError,
+    HAVNError,
     HAVNNetworkError,
     HAVNRateLimitError,
 )
 from .webhooks import TransactionWebhook, VoucherWebhook, AuthWebhook
 # UserSyncWebhook removed - deprecated (user management on SaaS side)
-from .utils.auth import build_auth_headers
+from .utils.auth import (
+    build_auth_headers,
+    create_hmac_template,
+    serialize_payload,
+    sign_serialized_payload,
+)
+from .utils.rate_limit import TokenBucket
+from .utils.retry import HAVNRetry
+from .utils.serialization import decode_json_response
 from .constants import (
     HTTP_METHOD_GET,
-    HTTP_METHOD_POST,
-    HTTP_METHOD_PUT,
-    HTTP_METHOD_PATCH,
-    HTTP_STATUS_OK,
-    HTTP_STATUS_CREATED,
+    METHODS_WITH_BODY,
+    RETRY_METHODS,
     HTTP_STATUS_UNAUTHORIZED,
     HTTP_STATUS_TOO_MANY_REQUESTS,
+    SUCCESS_STATUSES,
+    RETRY_STATUSES,
     HEADER_RATE_LIMIT_RESET,
     HEADER_RATE_LIMIT_LIMIT,
     HEADER_RATE_LIMIT_REMAINING,
+    HEADER_RETRY_AFTER,
+    HEADER_SIGNATURE,
     HEADER_TEST_MODE,
     TEST_MODE_VALUE,
     DEFAULT_SUCCESS_RESPONSE,
     DEFAULT_ERROR_TYPE,
     DEFAULT_RATE_LIMIT_MESSAGE,
+    DEFAULT_RATE_LIMIT_COOLDOWN,
     DEFAULT_AUTH_FAILED_MESSAGE,
 )
 
 
-def _parse_error_response(
-    response: requests.Response,
+def _parse_error_body(
+    body: Any,
     default_message: str,
     default_error_type: str = DEFAULT_ERROR_TYPE,
 ) -> Tuple[str, str]:
     """
-    Parse error response JSON (DRY helper)
+    Extract message and error type from a decoded error body (DRY helper)
 
     Args:
-        response: requests.Response object
+        body: Decoded JSON body (or None if the body was not JSON)
         default_message: Default error message
         default_error_type: Default error type
 
     Returns:
         Tuple of (message, error_type)
     """
-    try:
-        error_data = response.json()
-        message = error_data.get("message", default_message)
-        error_type = error_data.get("error", default_error_type)
-        return message, error_type
-    except (ValueError, KeyError):
+    if not isinstance(body, dict):
         return default_message, default_error_type
+    return (
+        body.get("message", default_message),
+        body.get("error", default_error_type),
+    )
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> Optional[int]:
+    """Read an integer header, returning None if missing or malformed"""
+    value = headers.get(name)
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
 
 
 def _extract_rate_limit_info(
-    response: requests.Response,
+    headers: Mapping[str, str],
 ) -> Tuple[Optional[int], Optional[int], Optional[int]]:
     """
     Extract rate limit info from headers (DRY helper)
 
+    `X-RateLimit-Reset` (epoch seconds) is preferred; `Retry-After`
+    (delta seconds) is used when the reset header is absent.
+
     Args:
-        response: requests.Response object
+        headers: Response headers mapping
 
     Returns:
         Tuple of (retry_after_seconds, limit, remaining)
     """
-    retry_after = response.headers.get(HEADER_RATE_LIMIT_RESET)
-    limit = response.headers.get(HEADER_RATE_LIMIT_LIMIT)
-    remaining = response.headers.get(HEADER_RATE_LIMIT_REMAINING)
-
     retry_after_seconds = None
-    if retry_after:
-        try:
-            reset_time = int(retry_after)
-            current_time = int(time.time())
-            retry_after_seconds = max(0, reset_time - current_time)
-        except (ValueError, TypeError):
-            pass
+    reset_time = _header_int(headers, HEADER_RATE_LIMIT_RESET)
+    if reset_time is not None:
+        retry_after_seconds = max(0, reset_time - int(time.time()))
+    else:
+        retry_after = _header_int(headers, HEADER_RETRY_AFTER)
+        if retry_after is not None:
+            retry_after_seconds = max(0, retry_after)
 
     return (
         retry_after_seconds,
-        int(limit) if limit else None,
-        int(remaining) if remaining else None,
+        _header_int(headers, HEADER_RATE_LIMIT_LIMIT),
+        _header_int(headers, HEADER_RATE_LIMIT_REMAINING),
     )
 
 
@@ -112,6 +133,10 @@ class HAVNClient:
         max_retries: Maximum number of retry attempts
         backoff_factor: Exponential backoff multiplier
         test_mode: Whether to enable dry-run mode (no data saved)
+        voucher_cache_ttl: Seconds to cache successful voucher validations (0 = disabled)
+        rate_limit: Local requests/second limit (None = paced by server headers only)
+        pool_maxsize: Keep-alive connections kept per host
+        retry_on_rate_limit: Whether 429 responses are waited out and retried
 
     Example:
         >>> # Initialize with explicit parameters
@@ -140,6 +165,11 @@ class HAVNClient:
         max_retries: Optional[int] = None,
         backoff_factor: Optional[float] = None,
         test_mode: bool = False,
+        voucher_cache_ttl: Optional[float] = None,
+        rate_limit: Optional[float] = None,
+        prewarm: bool = False,
+        pool_maxsize: Optional[int] = None,
+        retry_on_rate_limit: bool = False,
     ):
         """
         Initialize HAVN client
@@ -152,24 +182,43 @@ class HAVNClient:
             max_retries: Maximum retry attempts (default: 3)
             backoff_factor: Exponential backoff multiplier (default: 0.5)
             test_mode: Enable dry-run mode - requests succeed but don't save data (default: False)
+            voucher_cache_ttl: Seconds to cache successful voucher validations
+                (or uses HAVN_VOUCHER_CACHE_TTL env var, default: 0 = disabled)
+            rate_limit: Max requests per second sent by this client
+                (or uses HAVN_RATE_LIMIT env var, default: None = no local pacing).
+                Server rate-limit headers are always honored.
+            prewarm: Open the connection to base_url in a background thread so the
+                first real request skips the TCP/TLS handshake (default: False)
+            pool_maxsize: Keep-alive connections kept per host; raise it for
+                high-concurrency sends (or uses HAVN_POOL_MAXSIZE env var, default: 32)
+            retry_on_rate_limit: On 429, wait the server-reported time and retry
+                (up to max_retries) instead of raising HAVNRateLimitError
+                right away (default: False)
 
         Raises:
             ValueError: If api_key or webhook_secret is not provided and not in environment
         """
-        # Get configuration from params or environment
-        self.api_key = api_key or Config.get_api_key()
-        self.webhook_secret = webhook_secret or Config.get_webhook_secret()
-        self.base_url = (base_url or Config.get_base_url()).rstrip("/")
-        self.timeout = timeout if timeout is not None else Config.get_timeout()
-        self.max_retries = (
-            max_retries if max_retries is not None else Config.get_max_retries()
-        )
+        # Get configuration from params or environment (single env pass)
+        env = Config.get_client_env()
+        self.api_key = api_key or env.api_key
+        self.webhook_secret = webhook_secret or env.webhook_secret
+        self.base_url = (base_url or env.base_url).rstrip("/")
+        self.timeout = timeout if timeout is not None else env.timeout
+        self.max_retries = max_retries if max_retries is not None else env.max_retries
         self.backoff_factor = (
-            backoff_factor
-            if backoff_factor is not None
-            else Config.get_backoff_factor()
+            backoff_factor if backoff_factor is not None else env.backoff_factor
         )
         self.test_mode = test_mode
+        self.voucher_cache_ttl = (
+            voucher_cache_ttl
+            if voucher_cache_ttl is not None
+            else env.voucher_cache_ttl
+        )
+        self.rate_limit = rate_limit if rate_limit is not None else env.rate_limit
+        self.pool_maxsize = (
+            pool_maxsize if pool_maxsize is not None else env.pool_maxsize
+        )
+        self.retry_on_rate_limit = retry_on_rate_limit
 
         # Validate required parameters
         if not self.api_key:
@@ -184,9 +233,19 @@ class HAVNClient:
                 "Provide webhook_secret parameter or set HAVN_WEBHOOK_SECRET environment variable."
             )
 
+        # Self-pacing: local token bucket + server-reported rate-limit window
+        self._rate_limiter = TokenBucket(rate=self.rate_limit)
+
+        # Key the HMAC once; each request signs from a copy of this template
+        self._hmac_template = create_hmac_template(self.webhook_secret)
+        self._sign = self._create_signer(env.signature_cache_size)
+
         # Initialize HTTP session with retry logic
         self._session = self._create_session()
 
+        if prewarm:
+            self.prewarm()
+
         # Initialize webhook handlers
         self.transactions = TransactionWebhook(self)
         
@@ -198,40 +257,116 @@ class HAVNClient:
         self.vouchers = VoucherWebhook(self)
         self.auth = AuthWebhook(self)
 
+    def _create_signer(self, cache_size: int):
+        """
+        Create the payload-bytes -> signature function for this client
+
+        With `cache_size > 0` (HAVN_SIGNATURE_CACHE_SIZE) signatures are
+        memoized in an LRU keyed by the exact serialized bytes, so resending an
+        identical payload skips the HMAC. The signature has no timestamp or
+        nonce, so the cached value is always what the backend expects; the
+        cache is per client and never holds the secret itself.
+
+        Args:
+            cache_size: Max memoized signatures (0 = no caching)
+
+        Returns:
+            Callable taking serialized payload bytes, returning hex signature
+        """
+
+        def sign(payload_bytes: bytes) -> str:
+            return sign_serialized_payload(
+                payload_bytes, self.webhook_secret, self._hmac_template
+            )
+
+        if cache_size > 0:
+            return functools.lru_cache(maxsize=cache_size)(sign)
+        return sign
+
     def _create_session(self) -> requests.Session:
         """
-        Create requests session with retry logic
+        Create requests session with retry logic and connection pooling
+
+        The session lives as long as the client, so every request made through
+        this client reuses the same keep-alive connection pool. Call ``close()``
+        (or use the client as a context manager) to release it.
 
         Returns:
             Configured requests.Session
         """
         session = requests.Session()
 
+        # Static auth headers (Content-Type, Accept, X-API-Key) live on the
+        # session; per request only the signature varies. The empty-payload
+        # signature (GETs, bodyless POSTs) is constant, so compute it once here.
+        static_headers = build_auth_headers(
+            api_key=self.api_key,
+            webhook_secret=self.webhook_secret,
+            hmac_template=self._hmac_template,
+        )
+        self._empty_payload_signature = static_headers.pop(HEADER_SIGNATURE)
+        session.headers.update(static_headers)
+
         # Configure retry strategy
-        retry_strategy = Retry(
+        # Jittered backoff; honors Retry-After / X-RateLimit-Reset (capped at
+        # the request timeout). 429 is not retried blindly: the rate limiter
+        # blocks until the window resets and HAVNRateLimitError is raised
+        retry_strategy = HAVNRetry(
             total=self.max_retries,
             backoff_factor=self.backoff_factor,
-            status_forcelist=[
-                HTTP_STATUS_TOO_MANY_REQUESTS,
-                500,
-                502,
-                503,
-                504,
-            ],  # Retry on these status codes
-            allowed_methods=[
-                HTTP_METHOD_POST,
-                HTTP_METHOD_GET,
-            ],  # Retry POST requests (idempotent webhooks)
+            status_forcelist=RETRY_STATUSES,  # Retry on these status codes
+            allowed_methods=RETRY_METHODS,  # Retry POST requests (idempotent webhooks)
+            max_retry_after=self.timeout,
         )
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Keep-alive pool: sequential and concurrent calls to the same host
+        # reuse warm TCP/TLS connections instead of re-handshaking per request
+        # pool_block=False: a burst beyond pool_maxsize opens extra connections
+        # instead of waiting; only pool_maxsize of them are kept alive
+        adapter = HTTPAdapter(
+            pool_connections=Config.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False,
+            max_retries=retry_strategy,
+        )
         session.mount("https://", adapter)
         session.mount("http://", adapter)
 
         return session
 
+    def prewarm(self) -> threading.Thread:
+        """
+        Warm a keep-alive connection to the API in the background
+
+        Sends an unsigned HEAD to `base_url` on a daemon thread. The response
+        status is irrelevant; the point is that the TCP/TLS handshake happens
+        off the request path and the connection is left in the session pool.
+        Failures are ignored (the first real request simply connects itself).
+
+        Returns:
+            The started daemon thread (join it to wait for the warm-up)
+
+        Example:
+            >>> client = HAVNClient()
+            >>> client.prewarm()  # e.g., at app startup, before the first login
+        """
+
+        def _warm():
+            try:
+                self._session.head(self.base_url, timeout=self.timeout)
+            except requests.exceptions.RequestException:
+                pass
+
+        thread = threading.Thread(target=_warm, name="havn-prewarm", daemon=True)
+        thread.start()
+        return thread
+
     def _make_request(
-        self, method: str, endpoint: str, payload: Optional[Dict[str, Any]] = None
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
         """
         Make HTTP request to HAVN API
@@ -245,12 +380,13 @@ class HAVNClient:
         - HMAC signature generation
         - Request/response logging
         - Error handling
-        - Retry logic (via session)
+        - Retry logic (5xx via session; 429 here when `retry_on_rate_limit`)
 
         Args:
             method: HTTP method (POST, GET, etc.)
             endpoint: API endpoint path (e.g., "/api/v1/webhook/transaction")
             payload: Request payload dictionary
+            extra_headers: Additional headers (e.g., Idempotency-Key)
 
         Returns:
             Fresh response data as dictionary (always from backend)
@@ -259,7 +395,92 @@ class HAVNClient:
             HAVNAuthError: If authentication fails
             HAVNAPIError: If API returns error
             HAVNNetworkError: If network error occurs
+            HAVNRateLimitError: If rate limited and not retried (or retries exhausted)
+        """
+        return self._retry_rate_limited(
+            lambda: self._handle_response(
+                self._send_request(method, endpoint, payload, extra_headers)
+            )
+        )
+
+    def _retry_rate_limited(self, call: Callable[[], Any]) -> Any:
+        """
+        Run `call`, retrying on HAVNRateLimitError when `retry_on_rate_limit`
+
+        Shared by `_make_request` and handlers that send through
+        `_send_request` themselves (e.g., conditional GETs), so every request
+        gets the same 429 handling.
+
+        Args:
+            call: Zero-argument function that sends one request and parses it
+
+        Returns:
+            Result of `call`
+
+        Raises:
+            HAVNRateLimitError: If not retried (or retries exhausted)
+        """
+        attempt = 0
+        while True:
+            try:
+                return call()
+            except HAVNRateLimitError as e:
+                wait = self._rate_limit_wait(e, attempt)
+                if wait is None:
+                    raise
+                time.sleep(wait)
+                attempt += 1
+
+    def _rate_limit_wait(
+        self, error: HAVNRateLimitError, attempt: int
+    ) -> Optional[float]:
+        """
+        Seconds to wait before retrying a rate-limited request
+
+        Uses the parsed `retry_after`, capped at Config.DEFAULT_MAX_RATE_LIMIT_WAIT.
+        Without server timing, uses exponential backoff but never less than the
+        rate limiter's cooldown, so the retry is not rejected locally. Returns
+        None when the error should be raised instead (retries disabled or
+        exhausted).
+        """
+        if not self.retry_on_rate_limit or attempt >= self.max_retries:
+            return None
+        if error.retry_after is not None:
+            wait = float(error.retry_after)
+        else:
+            wait = max(self.backoff_factor * (2**attempt), DEFAULT_RATE_LIMIT_COOLDOWN)
+        return min(wait, Config.DEFAULT_MAX_RATE_LIMIT_WAIT)
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        Send signed HTTP request to HAVN API and return the raw response
+
+        Used directly by handlers that need response headers or non-2xx
+        statuses such as 304 Not Modified; everything else goes through
+        `_make_request`.
+
+        Args:
+            method: HTTP method (POST, GET, etc.)
+            endpoint: API endpoint path (e.g., "/api/v1/webhook/transaction")
+            payload: Request payload dictionary
+            extra_headers: Additional request headers (e.g., If-None-Match)
+
+        Returns:
+            requests.Response object
+
+        Raises:
+            HAVNNetworkError: If network error occurs
+            HAVNRateLimitError: If the server rate-limit window is exhausted
+                (raised locally, without sending the request)
         """
+        self._rate_limiter.acquire()
+
         url = f"{self.base_url}{endpoint}"
 
         # For GET requests, signature is calculated from empty dict (matches backend)
@@ -267,24 +488,31 @@ class HAVNClient:
         # Query params are passed separately, not in signature calculation
         signature_payload = None if method == HTTP_METHOD_GET else payload
 
-        # Build headers with authentication (always include signature for webhook endpoints)
-        headers = build_auth_headers(
-            payload=signature_payload,
-            api_key=self.api_key,
-            webhook_secret=self.webhook_secret,
-        )
+        # Serialize once: the canonical signing bytes double as the JSON body
+        serialized_payload = None
+        if signature_payload:
+            serialized_payload = serialize_payload(signature_payload)
+            signature = self._sign(serialized_payload)
+        else:
+            signature = self._empty_payload_signature
+
+        # Static auth headers are merged in from the session
+        headers = {HEADER_SIGNATURE: signature}
 
         # Add test mode header if enabled
         if self.test_mode:
             headers[HEADER_TEST_MODE] = TEST_MODE_VALUE
 
+        if extra_headers:
+            headers.update(extra_headers)
+
         # For GET requests, use params, for POST/PUT/PATCH use JSON data
         data = None
         params = None
         if method == HTTP_METHOD_GET:
             params = payload
-        elif method in [HTTP_METHOD_POST, HTTP_METHOD_PUT, HTTP_METHOD_PATCH]:
-            data = json.dumps(payload) if payload else None
+        elif method in METHODS_WITH_BODY:
+            data = serialized_payload
 
         try:
             response = self._session.request(
@@ -296,9 +524,6 @@ class HAVNClient:
                 timeout=self.timeout,
             )
 
-            # Handle response
-            return self._handle_response(response)
-
         except requests.exceptions.Timeout as e:
             raise HAVNNetworkError(
                 f"Request timeout after {self.timeout} seconds", original_error=e
@@ -308,10 +533,22 @@ class HAVNClient:
         except requests.exceptions.RequestException as e:
             raise HAVNNetworkError(f"Request failed: {str(e)}", original_error=e)
 
+        # Track the server window so exhausted quotas fail fast next time
+        retry_after_seconds, _, remaining = _extract_rate_limit_info(response.headers)
+        self._rate_limiter.update(
+            remaining=remaining,
+            reset_after=retry_after_seconds,
+            limited=response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS,
+        )
+
+        return response
+
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
         Handle API response
 
+        The body is decoded at most once, whatever the status.
+
         Args:
             response: requests.Response object
 
@@ -323,13 +560,25 @@ class HAVNClient:
             HAVNRateLimitError: If rate limit exceeded (429)
             HAVNAPIError: If API returns error
         """
+        status_code = response.status_code
+
+        try:
+            body = decode_json_response(response)
+        except ValueError:
+            body = None
+
+        # Success (200 OK or 201 Created)
+        if status_code in SUCCESS_STATUSES:
+            # No JSON body (e.g., voucher validation returns empty body)
+            return body if body is not None else DEFAULT_SUCCESS_RESPONSE
+
         # Rate limit error (429)
-        if response.status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
+        if status_code == HTTP_STATUS_TOO_MANY_REQUESTS:
             # Extract rate limit info from headers
-            retry_after_seconds, limit, remaining = _extract_rate_limit_info(response)
-
-            # Parse error message
-            message, _ = _parse_error_response(response, DEFAULT_RATE_LIMIT_MESSAGE)
+            retry_after_seconds, limit, remaining = _extract_rate_limit_info(
+                response.headers
+            )
+            message, _ = _parse_error_body(body, DEFAULT_RATE_LIMIT_MESSAGE)
 
             raise HAVNRateLimitError(
                 message=message,
@@ -339,36 +588,65 @@ class HAVNClient:
             )
 
         # Authentication error (401)
-        if response.status_code == HTTP_STATUS_UNAUTHORIZED:
-            message, _ = _parse_error_response(response, DEFAULT_AUTH_FAILED_MESSAGE)
+        if status_code == HTTP_STATUS_UNAUTHORIZED:
+            message, _ = _parse_error_body(body, DEFAULT_AUTH_FAILED_MESSAGE)
             raise HAVNAuthError(message)
 
-        # Success (200 OK or 201 Created)
-        if response.status_code in [HTTP_STATUS_OK, HTTP_STATUS_CREATED]:
-            try:
-                return response.json()
-            except ValueError:
-                # No JSON body (e.g., voucher validation returns empty body)
-                return DEFAULT_SUCCESS_RESPONSE
-
         # API error (4xx, 5xx)
-        message, error_type = _parse_error_response(
-            response, f"API error: {response.status_code}", DEFAULT_ERROR_TYPE
+        message, error_type = _parse_error_body(
+            body, f"API error: {status_code}", DEFAULT_ERROR_TYPE
         )
 
-        # Get error data if available
-        error_data = None
-        try:
-            error_data = response.json()
-        except (ValueError, KeyError):
-            pass
-
         raise HAVNAPIError(
             message=f"[{error_type}] {message}",
-            status_code=response.status_code,
-            response=error_data,
+            status_code=status_code,
+            response=body,
         )
 
+    def send_many(
+        self,
+        calls: List[Callable[[], Any]],
+        max_workers: int = 16,
+    ) -> List[Union[Any, HAVNError]]:
+        """
+        Run multiple SDK calls concurrently
+
+        Each entry is a zero-argument callable (e.g., a `functools.partial` of a
+        handler method). Calls run on a thread pool and share this client's
+        session, so they reuse its keep-alive connections; the client is safe
+        to use from several threads. Workers are capped at `pool_maxsize` so
+        no call waits for (or opens) an extra connection.
+
+        A failing call does not abort the others: its HAVNError is returned in
+        place of the result, in the same position as the input.
+
+        Args:
+            calls: List of zero-argument callables
+            max_workers: Maximum concurrent calls (default: 16)
+
+        Returns:
+            List of call results or HAVNError, in input order
+
+        Example:
+            >>> from functools import partial
+            >>> results = client.send_many([
+            ...     partial(client.vouchers.validate, "HAVN-AQNEO-S08-ABC123"),
+            ...     partial(client.transactions.send, **transaction),
+            ... ])
+        """
+        if not calls:
+            return []
+
+        def _call_one(call: Callable[[], Any]) -> Union[Any, HAVNError]:
+            try:
+                return call()
+            except HAVNError as e:
+                return e
+
+        workers = max(1, min(max_workers, self.pool_maxsize, len(calls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_call_one, calls))
+
     def close(self):
         """Close HTTP session"""
         if hasattr(self, "_session"):
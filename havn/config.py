@@ -3,7 +3,47 @@ Configuration for HAVN SDK
 """
 
 import os
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, Optional, Tuple
+
+# Environment variables read by HAVNClient, in ClientEnv field order
+_CLIENT_ENV_VARS = (
+    "HAVN_API_KEY",
+    "HAVN_WEBHOOK_SECRET",
+    "HAVN_BASE_URL",
+    "HAVN_TIMEOUT",
+    "HAVN_MAX_RETRIES",
+    "HAVN_BACKOFF_FACTOR",
+    "HAVN_VOUCHER_CACHE_TTL",
+    "HAVN_RATE_LIMIT",
+    "HAVN_POOL_MAXSIZE",
+    "HAVN_SIGNATURE_CACHE_SIZE",
+)
+
+
+class ClientEnv(NamedTuple):
+    """Parsed HAVNClient settings from environment (defaults applied)"""
+
+    api_key: Optional[str]
+    webhook_secret: Optional[str]
+    base_url: str
+    timeout: int
+    max_retries: int
+    backoff_factor: float
+    voucher_cache_ttl: float
+    rate_limit: Optional[float]
+    pool_maxsize: int
+    signature_cache_size: int
+
+
+def _parse_env_value(value: Optional[str], cast, default):
+    """Cast raw env value, falling back to default if missing or malformed"""
+    if not value:
+        return default
+    try:
+        return cast(value)
+    except (ValueError, TypeError):
+        return default
 
 
 class Config:
@@ -14,12 +54,43 @@ class Config:
     DEFAULT_TIMEOUT = 30  # seconds
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_BACKOFF_FACTOR = 0.5  # seconds
+    DEFAULT_POOL_CONNECTIONS = 10  # Number of host pools to cache
+    DEFAULT_POOL_MAXSIZE = 32  # Keep-alive connections kept per host
+
+    DEFAULT_RATE_LIMIT = None  # Local requests/second (None = server-paced only)
+    DEFAULT_MAX_RATE_LIMIT_WAIT = 60  # Longest single 429 retry sleep (seconds)
+    # Signatures memoized per payload (0 = disabled). Safe only because the
+    # signature covers the body alone (no timestamp/nonce).
+    DEFAULT_SIGNATURE_CACHE_SIZE = 0
+
+    # Voucher validation cache defaults (0 = disabled, always ask backend)
+    DEFAULT_VOUCHER_CACHE_TTL = 0  # seconds a validation result stays fresh
+    DEFAULT_VOUCHER_CACHE_STALE_TTL = 300  # seconds a stale result may be served
+
+    # Transaction dedupe cache (successful sends replayed locally by idempotency key)
+    DEFAULT_IDEMPOTENCY_CACHE_TTL = 600  # seconds a sent transaction is deduped
+    DEFAULT_IDEMPOTENCY_CACHE_MAXSIZE = 4096  # max remembered transactions
 
     # Currency exchange rate defaults
     DEFAULT_EXCHANGE_RATE_API_URL = "https://api.exchangerate-api.com/v4/latest/USD"
     DEFAULT_EXCHANGE_RATE_CACHE_DURATION_HOURS = 24  # Cache rates for 24 hours
     DEFAULT_CURRENCY_API_TIMEOUT = 5  # API request timeout in seconds
 
+    @staticmethod
+    def get_client_env() -> ClientEnv:
+        """
+        Get all HAVNClient settings from environment in one pass
+
+        Parsing is memoized on the raw values, so repeated client construction
+        skips int/float conversion while still picking up env changes made at
+        runtime (e.g., os.environ updates before creating a new client).
+
+        Returns:
+            ClientEnv with defaults applied
+        """
+        raw = tuple(os.environ.get(name) for name in _CLIENT_ENV_VARS)
+        return _parse_client_env(raw)
+
     @staticmethod
     def get_api_key() -> Optional[str]:
         """Get API key from environment"""
@@ -81,6 +152,11 @@ class Config:
         except (ValueError, TypeError):
             return Config.DEFAULT_EXCHANGE_RATE_CACHE_DURATION_HOURS
 
+    @staticmethod
+    def get_exchange_rate_cache_file() -> Optional[str]:
+        """Get exchange rate cache file path from environment (None = memory only)"""
+        return os.getenv("HAVN_EXCHANGE_RATE_CACHE_FILE") or None
+
     @staticmethod
     def get_currency_api_timeout() -> Optional[int]:
         """Get currency API timeout from environment"""
@@ -92,3 +168,40 @@ class Config:
             )
         except (ValueError, TypeError):
             return Config.DEFAULT_CURRENCY_API_TIMEOUT
+
+
+@lru_cache(maxsize=8)
+def _parse_client_env(raw: Tuple[Optional[str], ...]) -> ClientEnv:
+    """Parse raw client env values (cached per distinct environment)"""
+    (
+        api_key,
+        webhook_secret,
+        base_url,
+        timeout,
+        max_retries,
+        backoff_factor,
+        voucher_cache_ttl,
+        rate_limit,
+        pool_maxsize,
+        signature_cache_size,
+    ) = raw
+    return ClientEnv(
+        api_key=api_key,
+        webhook_secret=webhook_secret,
+        base_url=base_url if base_url is not None else Config.DEFAULT_BASE_URL,
+        timeout=_parse_env_value(timeout, int, Config.DEFAULT_TIMEOUT),
+        max_retries=_parse_env_value(max_retries, int, Config.DEFAULT_MAX_RETRIES),
+        backoff_factor=_parse_env_value(
+            backoff_factor, float, Config.DEFAULT_BACKOFF_FACTOR
+        ),
+        voucher_cache_ttl=_parse_env_value(
+            voucher_cache_ttl, float, Config.DEFAULT_VOUCHER_CACHE_TTL
+        ),
+        rate_limit=_parse_env_value(rate_limit, float, Config.DEFAULT_RATE_LIMIT),
+        pool_maxsize=_parse_env_value(
+            pool_maxsize, int, Config.DEFAULT_POOL_MAXSIZE
+        ),
+        signature_cache_size=_parse_env_value(
+            signature_cache_size, int, Config.DEFAULT_SIGNATURE_CACHE_SIZE
+        ),
+    )
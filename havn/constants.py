@@ -12,20 +12,39 @@ HTTP_METHOD_GET = "GET"
 HTTP_METHOD_POST = "POST"
 HTTP_METHOD_PUT = "PUT"
 HTTP_METHOD_PATCH = "PATCH"
+METHODS_WITH_BODY = frozenset({HTTP_METHOD_POST, HTTP_METHOD_PUT, HTTP_METHOD_PATCH})
+# Methods urllib3 may retry (POST is safe: requests carry an Idempotency-Key)
+RETRY_METHODS = frozenset({HTTP_METHOD_POST, HTTP_METHOD_GET})
 
 # HTTP status codes
 HTTP_STATUS_OK = 200
 HTTP_STATUS_CREATED = 201
+HTTP_STATUS_NOT_MODIFIED = 304
 HTTP_STATUS_BAD_REQUEST = 400
 HTTP_STATUS_UNAUTHORIZED = 401
 HTTP_STATUS_NOT_FOUND = 404
 HTTP_STATUS_UNPROCESSABLE_ENTITY = 422
 HTTP_STATUS_TOO_MANY_REQUESTS = 429
+SUCCESS_STATUSES = frozenset({HTTP_STATUS_OK, HTTP_STATUS_CREATED})
+# Transient server errors retried by urllib3 (429 is handled by the rate limiter)
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+
+# Auth headers
+HEADER_SIGNATURE = "X-Signature"
 
 # Rate limit headers
 HEADER_RATE_LIMIT_RESET = "X-RateLimit-Reset"
 HEADER_RATE_LIMIT_LIMIT = "X-RateLimit-Limit"
 HEADER_RATE_LIMIT_REMAINING = "X-RateLimit-Remaining"
+HEADER_RETRY_AFTER = "Retry-After"
+
+# Conditional request / caching headers
+HEADER_ETAG = "ETag"
+HEADER_IF_NONE_MATCH = "If-None-Match"
+HEADER_CACHE_CONTROL = "Cache-Control"
+
+# Retry-safe mutation header
+HEADER_IDEMPOTENCY_KEY = "Idempotency-Key"
 
 # Test mode
 HEADER_TEST_MODE = "X-Test-Mode"
@@ -35,6 +54,8 @@ TEST_MODE_VALUE = "true"
 DEFAULT_SUCCESS_RESPONSE = {"success": True}
 DEFAULT_ERROR_TYPE = "APIError"
 DEFAULT_RATE_LIMIT_MESSAGE = "Rate limit exceeded. Please try again later."
+# Block applied after a 429 that carries no Retry-After / reset header (seconds)
+DEFAULT_RATE_LIMIT_COOLDOWN = 1.0
 DEFAULT_AUTH_FAILED_MESSAGE = "Authentication failed"
 
 # Date format
@@ -6,12 +6,24 @@ Custom exceptions for HAVN SDK
 class HAVNError(Exception):
     """Base exception for all HAVN SDK errors"""
 
-    pass
+    # Subclasses keep their fields in __slots__, so raising one does not
+    # allocate an instance __dict__
+
+    def __reduce__(self):
+        # Exception pickling only restores __dict__; carry slot values too
+        state = dict(self.__dict__)
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return type(self), self.args, state or None
 
 
 class HAVNAPIError(HAVNError):
     """Exception raised for API errors"""
 
+    __slots__ = ("message", "status_code", "response")
+
     def __init__(self, message: str, status_code: int = None, response: dict = None):
         self.message = message
         self.status_code = status_code
@@ -27,6 +39,8 @@ class HAVNAPIError(HAVNError):
 class HAVNAuthError(HAVNError):
     """Exception raised for authentication errors"""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str = "Authentication failed"):
         self.message = message
         super().__init__(self.message)
@@ -35,6 +49,8 @@ class HAVNAuthError(HAVNError):
 class HAVNValidationError(HAVNError):
     """Exception raised for validation errors"""
 
+    __slots__ = ("message", "errors")
+
     def __init__(self, message: str, errors: dict = None):
         self.message = message
         self.errors = errors or {}
@@ -49,6 +65,8 @@ class HAVNValidationError(HAVNError):
 class HAVNNetworkError(HAVNError):
     """Exception raised for network-related errors"""
 
+    __slots__ = ("message", "original_error")
+
     def __init__(self, message: str, original_error: Exception = None):
         self.message = message
         self.original_error = original_error
@@ -63,6 +81,8 @@ class HAVNNetworkError(HAVNError):
 class HAVNRateLimitError(HAVNError):
     """Exception raised when rate limit is exceeded"""
 
+    __slots__ = ("message", "retry_after", "limit", "remaining")
+
     def __init__(
         self,
         message: str,
@@ -3,7 +3,26 @@ Transaction models for HAVN SDK
 """
 
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+
+from ..utils.validators import (
+    validate_amount,
+    validate_currency,
+    validate_custom_fields,
+    validate_email,
+    validate_referral_code,
+)
+from .base import with_slots
+
+# Allowed values checked on every validate(); built once at import
+_VALID_CUSTOMER_TYPES = frozenset(("NEW_CUSTOMER", "RECURRING"))
+_VALID_ACQUISITION_METHODS = frozenset(("REFERRAL", "REFERRAL_VOUCHER"))
+_INVALID_ACQUISITION_METHOD_HINT = "Must be one of: REFERRAL, REFERRAL_VOUCHER"
+
+
+def _upper(value: str) -> str:
+    """Uppercase without a copy when the value is already uppercase"""
+    return value if value.isupper() else value.upper()
 
 
 @dataclass
@@ -55,9 +74,28 @@ class TransactionPayload:
     description: Optional[str] = None
     server_side_conversion: Optional[bool] = None
 
+    def __post_init__(self):
+        """
+        Normalize string fields once at construction
+
+        Codes are trimmed and uppercased, and blank optional fields become
+        None, so `to_dict()` sends normalized values even before `validate()`
+        and `validate()` itself only checks. Non-string values are left as-is
+        for `validate()` to reject.
+        """
+        if isinstance(self.referral_code, str):
+            self.referral_code = _upper(self.referral_code.strip())
+        if isinstance(self.payment_gateway, str):
+            self.payment_gateway = _upper(self.payment_gateway.strip())
+        if isinstance(self.customer_type, str):
+            self.customer_type = _upper(self.customer_type.strip()) or None
+        if isinstance(self.invoice_id, str):
+            self.invoice_id = self.invoice_id.strip() or None
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, removing None values"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Shallow: fields are primitives/JSON-ready, so skip asdict's deepcopy
+        return {k: v for k, v in self.__dict__.items() if v is not None}
 
     def validate(self) -> None:
         """
@@ -66,13 +104,6 @@ class TransactionPayload:
         Raises:
             ValueError: If validation fails
         """
-        from ..utils.validators import (
-            validate_amount,
-            validate_currency,
-            validate_custom_fields,
-            validate_referral_code,
-        )
-
         # Validate amount
         validate_amount(self.amount)
 
@@ -86,26 +117,20 @@ class TransactionPayload:
         if self.referral_code is None or not isinstance(self.referral_code, str):
             raise ValueError("referral_code is required and must be a string")
 
-        referral_clean = self.referral_code.strip()
-        if not referral_clean:
+        if not self.referral_code:
             raise ValueError("referral_code is required and cannot be empty")
 
-        self.referral_code = referral_clean.upper()
         validate_referral_code(self.referral_code)
 
         # Validate customer_type (optional manual override)
-        if self.customer_type is not None:
-            normalized_type = self.customer_type.strip().upper()
-
-            if not normalized_type:
-                self.customer_type = None
-            elif normalized_type not in ["NEW_CUSTOMER", "RECURRING"]:
-                raise ValueError(
-                    f"Invalid customer_type: {self.customer_type}. "
-                    "Must be 'NEW_CUSTOMER' or 'RECURRING'"
-                )
-            else:
-                self.customer_type = normalized_type
+        if (
+            self.customer_type is not None
+            and self.customer_type not in _VALID_CUSTOMER_TYPES
+        ):
+            raise ValueError(
+                f"Invalid customer_type: {self.customer_type}. "
+                "Must be 'NEW_CUSTOMER' or 'RECURRING'"
+            )
 
         # Validate subtotal_transaction
         if self.subtotal_transaction is not None:
@@ -130,45 +155,35 @@ class TransactionPayload:
             )
 
         # Validate payment_gateway (required, <= 100 chars to match backend model)
-        if not self.payment_gateway or not self.payment_gateway.strip():
+        if not self.payment_gateway:
             raise ValueError("payment_gateway is required and cannot be empty")
 
-        gateway_clean = self.payment_gateway.strip().upper()
-        if len(gateway_clean) > 100:
+        if len(self.payment_gateway) > 100:
             raise ValueError("payment_gateway cannot exceed 100 characters")
-        self.payment_gateway = gateway_clean
 
         # Validate customer_email (required, non-empty, valid format)
         if not self.customer_email or not self.customer_email.strip():
             raise ValueError("customer_email is required and cannot be empty")
 
-        from ..utils.validators import validate_email
-
         try:
             validate_email(self.customer_email)
         except ValueError as e:
             raise ValueError(f"Invalid customer_email format: {e}")
 
-        # Normalize invoice_id (optional, <= 100 chars)
+        # Validate invoice_id (optional, <= 100 chars)
         if self.invoice_id is not None:
             if not isinstance(self.invoice_id, str):
                 raise ValueError("invoice_id must be a string if provided")
 
-            invoice_clean = self.invoice_id.strip()
-            if not invoice_clean:
-                self.invoice_id = None
-            elif len(invoice_clean) > 100:
+            if len(self.invoice_id) > 100:
                 raise ValueError("invoice_id cannot exceed 100 characters")
-            else:
-                self.invoice_id = invoice_clean
 
         # Validate acquisition_method (optional, but must be valid if provided)
         if self.acquisition_method:
-            valid_methods = ["REFERRAL", "REFERRAL_VOUCHER"]
-            if self.acquisition_method.upper() not in valid_methods:
+            if self.acquisition_method.upper() not in _VALID_ACQUISITION_METHODS:
                 raise ValueError(
                     f"Invalid acquisition_method: {self.acquisition_method}. "
-                    f"Must be one of: {', '.join(valid_methods)}"
+                    f"{_INVALID_ACQUISITION_METHOD_HINT}"
                 )
 
         # Validate server_side_conversion flag type (if provided)
@@ -178,6 +193,7 @@ class TransactionPayload:
             raise ValueError("server_side_conversion must be a boolean if provided")
 
 
+@with_slots
 @dataclass
 class CommissionData:
     """Commission data from response"""
@@ -194,18 +210,21 @@ class CommissionData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "CommissionData":
         """Create from dictionary"""
+        get = data.get
+        # Positional in field order: cheaper than keywords for bulk-built models
         return cls(
-            commission_id=data.get("commission_id", ""),
-            associate_id=data.get("associate_id", ""),
-            level=data.get("level", 0),
-            amount=data.get("amount", 0),
-            percentage=data.get("percentage", 0.0),
-            type=data.get("type", ""),
-            direction=data.get("direction", ""),
-            status=data.get("status", ""),
+            get("commission_id", ""),
+            get("associate_id", ""),
+            get("level", 0),
+            get("amount", 0),
+            get("percentage", 0.0),
+            get("type", ""),
+            get("direction", ""),
+            get("status", ""),
         )
 
 
+@with_slots
 @dataclass
 class TransactionData:
     """Transaction data from response"""
@@ -223,19 +242,21 @@ class TransactionData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TransactionData":
         """Create from dictionary"""
+        get = data.get
         return cls(
-            transaction_id=data.get("transaction_id", ""),
-            amount=data.get("amount", 0),
-            currency=data.get("currency", "USD"),
-            status=data.get("status", ""),
-            customer_type=data.get("customer_type", ""),
-            acquisition_method=data.get("acquisition_method"),
-            subtotal_transaction=data.get("subtotal_transaction"),
-            subtotal_discount=data.get("subtotal_discount"),
-            created_at=data.get("created_at"),
+            get("transaction_id", ""),
+            get("amount", 0),
+            get("currency", "USD"),
+            get("status", ""),
+            get("customer_type", ""),
+            get("acquisition_method"),
+            get("subtotal_transaction"),
+            get("subtotal_discount"),
+            get("created_at"),
         )
 
 
+@with_slots
 @dataclass
 class TransactionResponse:
     """
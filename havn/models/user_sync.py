@@ -3,7 +3,18 @@ User sync models for HAVN SDK
 """
 
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+from ..utils.validators import validate_email, validate_referral_code
+from .base import with_slots
+
+# Sentinel for optional per-user keys where None is itself an invalid value
+_MISSING = object()
+
+
+def _user_error(idx: int, message: str) -> ValueError:
+    """Build a per-user validation error (kept out of the validation loop)"""
+    return ValueError(f"User at index {idx}: {message}")
 
 
 @dataclass
@@ -45,7 +56,8 @@ class UserSyncPayload:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, removing None values"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Shallow: fields are primitives/JSON-ready, so skip asdict's deepcopy
+        return {k: v for k, v in self.__dict__.items() if v is not None}
 
     def validate(self) -> None:
         """
@@ -54,8 +66,6 @@ class UserSyncPayload:
         Raises:
             ValueError: If validation fails
         """
-        from ..utils.validators import validate_email, validate_referral_code
-
         # Validate email
         validate_email(self.email)
 
@@ -82,6 +92,7 @@ class UserSyncPayload:
                 raise ValueError("Country code must be uppercase")
 
 
+@with_slots
 @dataclass
 class UserData:
     """User data from response"""
@@ -96,16 +107,19 @@ class UserData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UserData":
         """Create from dictionary"""
+        get = data.get
+        # Positional in field order: cheaper than keywords for bulk-built models
         return cls(
-            id=data.get("id", ""),
-            email=data.get("email", ""),
-            name=data.get("name", ""),
-            is_active=data.get("is_active", False),
-            google_id=data.get("google_id"),
-            avatar=data.get("avatar"),
+            get("id", ""),
+            get("email", ""),
+            get("name", ""),
+            get("is_active", False),
+            get("google_id"),
+            get("avatar"),
         )
 
 
+@with_slots
 @dataclass
 class AssociateData:
     """Associate data from response"""
@@ -120,16 +134,18 @@ class AssociateData:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AssociateData":
         """Create from dictionary"""
+        get = data.get
         return cls(
-            associate_id=data.get("associate_id", ""),
-            associate_name=data.get("associate_name", ""),
-            referral_code=data.get("referral_code", ""),
-            type=data.get("type", ""),
-            is_active=data.get("is_active", False),
-            upline_id=data.get("upline_id"),
+            get("associate_id", ""),
+            get("associate_name", ""),
+            get("referral_code", ""),
+            get("type", ""),
+            get("is_active", False),
+            get("upline_id"),
         )
 
 
+@with_slots
 @dataclass
 class UserSyncResponse:
     """
@@ -151,7 +167,7 @@ class UserSyncResponse:
     associate_created: bool
     user: UserData
     associate: Optional[AssociateData] = None
-    raw_response: Dict[str, Any] = None
+    raw_response: Optional[Dict[str, Any]] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "UserSyncResponse":
@@ -229,60 +245,57 @@ class BulkUserSyncPayload:
         Raises:
             ValueError: If validation fails
         """
-        from ..utils.validators import validate_email, validate_referral_code
-
         # Validate users list
         if not isinstance(self.users, list):
             raise ValueError("'users' must be a list")
 
-        if len(self.users) == 0:
+        user_count = len(self.users)
+        if user_count == 0:
             raise ValueError("'users' cannot be empty")
 
-        if len(self.users) > 50:
-            raise ValueError(f"Maximum 50 users per batch. Received {len(self.users)}")
+        if user_count > 50:
+            raise ValueError(f"Maximum 50 users per batch. Received {user_count}")
 
-        # Validate each user
+        # Validate each user (bind user.get once per iteration)
         for idx, user in enumerate(self.users):
             if not isinstance(user, dict):
                 raise ValueError(f"User at index {idx} must be a dictionary")
 
-            email = user.get("email")
-            name = user.get("name")
+            get = user.get
+            email = get("email")
+            name = get("name")
 
             if not email or not name:
-                raise ValueError(
-                    f"User at index {idx}: missing required field 'email' or 'name'"
-                )
+                raise _user_error(idx, "missing required field 'email' or 'name'")
 
             validate_email(email)
 
             if not name.strip():
-                raise ValueError(f"User at index {idx}: name cannot be empty")
+                raise _user_error(idx, "name cannot be empty")
 
             if len(name) > 200:
-                raise ValueError(
-                    f"User at index {idx}: name cannot exceed 200 characters"
-                )
+                raise _user_error(idx, "name cannot exceed 200 characters")
 
             # Validate optional fields per user
-            validate_referral_code(user.get("upline_code"))
-            validate_referral_code(user.get("referral_code"))
-
-            country_code = user.get("country_code")
+            upline_code = get("upline_code")
+            if upline_code is not None:
+                validate_referral_code(upline_code)
+            referral_code = get("referral_code")
+            if referral_code is not None:
+                validate_referral_code(referral_code)
+
+            country_code = get("country_code")
             if country_code is not None:
                 if len(country_code) != 2:
-                    raise ValueError(
-                        f"User at index {idx}: country code must be 2 characters"
-                    )
+                    raise _user_error(idx, "country code must be 2 characters")
                 if not country_code.isupper():
-                    raise ValueError(
-                        f"User at index {idx}: country code must be uppercase"
-                    )
+                    raise _user_error(idx, "country code must be uppercase")
 
             # Validate is_owner per-user
-            if "is_owner" in user:
-                if not isinstance(user.get("is_owner"), bool):
-                    raise ValueError(f"User at index {idx}: is_owner must be boolean")
+            is_owner = get("is_owner", _MISSING)
+            if is_owner is not _MISSING:
+                if not isinstance(is_owner, bool):
+                    raise _user_error(idx, "is_owner must be boolean")
 
         # Validate shared fields
         validate_referral_code(self.upline_code)
@@ -294,6 +307,7 @@ class BulkUserSyncPayload:
                 raise ValueError("is_owner must be boolean")
 
 
+@with_slots
 @dataclass
 class BulkSyncSummary:
     """Bulk sync summary"""
@@ -305,13 +319,15 @@ class BulkSyncSummary:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BulkSyncSummary":
         """Create from dictionary"""
+        get = data.get
         return cls(
-            total=data.get("total", 0),
-            success=data.get("success", 0),
-            errors=data.get("errors", 0),
+            get("total", 0),
+            get("success", 0),
+            get("errors", 0),
         )
 
 
+@with_slots
 @dataclass
 class BulkUserSyncResponse:
     """
@@ -333,7 +349,7 @@ class BulkUserSyncResponse:
     summary: BulkSyncSummary
     referral_code: Optional[str] = None
     errors: Optional[List[Dict[str, Any]]] = None
-    raw_response: Dict[str, Any] = None
+    raw_response: Optional[Dict[str, Any]] = None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BulkUserSyncResponse":
@@ -352,7 +368,7 @@ class BulkUserSyncResponse:
         return cls(
             success=data.get("success", False),
             message=data.get("message", ""),
-            results=[UserSyncResponse.from_dict(result) for result in results_data],
+            results=list(map(UserSyncResponse.from_dict, results_data)),
             summary=BulkSyncSummary.from_dict(summary_data),
             referral_code=data.get("referral_code"),
             errors=data.get("errors"),
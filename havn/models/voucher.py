@@ -2,8 +2,74 @@
 Voucher models for HAVN SDK
 """
 
-from typing import Optional, Dict, Any
-from dataclasses import dataclass, asdict
+import re
+from datetime import date, datetime
+from typing import Callable, Optional, Dict, Any
+from dataclasses import dataclass
+
+from ..constants import DATE_FORMAT
+from ..utils.validators import validate_amount, validate_currency
+
+# Filter date formats: canonical shape by regex, then calendar check via C
+# fromisoformat; anything else falls back to strptime (e.g., "2024-1-5")
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+_DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}", re.ASCII)
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+_DATE_FIELDS = ("start_date_from", "start_date_to", "end_date_from", "end_date_to")
+_DATETIME_FIELDS = ("created_from", "created_to")
+
+# Allowed filter values (tuples keep error-message order; frozensets for lookup)
+_VOUCHER_TYPES = ("DISCOUNT_PERCENTAGE", "DISCOUNT_FIXED")
+_CLIENT_TYPES = ("NEW_CUSTOMER", "RECURRING")
+_SORT_FIELDS = (
+    "code",
+    "type",
+    "value",
+    "start_date",
+    "end_date",
+    "created_date",
+    "current_usage",
+    "usage_limit",
+    "min_purchase",
+)
+_SORT_ORDERS = ("asc", "desc")
+_VOUCHER_TYPE_SET = frozenset(_VOUCHER_TYPES)
+_CLIENT_TYPE_SET = frozenset(_CLIENT_TYPES)
+_SORT_FIELD_SET = frozenset(_SORT_FIELDS)
+_SORT_ORDER_SET = frozenset(_SORT_ORDERS)
+
+
+def _parses(parse: Callable[[str], Any], value: str) -> bool:
+    """Check value is accepted by parse (a real calendar date/time)"""
+    try:
+        parse(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _strptime_matches(value: str, fmt: str) -> bool:
+    """Slow path for non-canonical shapes (e.g., "2024-1-5"), as strptime accepts"""
+    return _parses(lambda v: datetime.strptime(v, fmt), value)
+
+
+def _is_valid_date(value: str) -> bool:
+    """Check a YYYY-MM-DD filter value"""
+    if _DATE_PATTERN.fullmatch(value):
+        return _parses(date.fromisoformat, value)
+    return _strptime_matches(value, DATE_FORMAT)
+
+
+def _is_valid_date_or_datetime(value: str) -> bool:
+    """Check a YYYY-MM-DDTHH:MM:SS or YYYY-MM-DD filter value"""
+    # Pick the parser by shape first, so valid canonical input never raises
+    if _DATETIME_PATTERN.fullmatch(value):
+        return _parses(datetime.fromisoformat, value)
+    if _DATE_PATTERN.fullmatch(value):
+        return _parses(date.fromisoformat, value)
+    return _strptime_matches(value, _DATETIME_FORMAT) or _strptime_matches(
+        value, DATE_FORMAT
+    )
 
 
 @dataclass
@@ -65,16 +131,12 @@ class VoucherListFilters:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for query params"""
-        result = {}
-        for key, value in asdict(self).items():
-            if value is not None:
-                if isinstance(value, bool):
-                    result[key] = value  # Keep as boolean, requests will handle it
-                elif isinstance(value, (int, float)):
-                    result[key] = str(value)
-                else:
-                    result[key] = str(value)
-        return result
+        # Booleans stay booleans (requests encodes them); everything else is str
+        return {
+            key: value if isinstance(value, bool) else str(value)
+            for key, value in self.__dict__.items()
+            if value is not None
+        }
 
     def validate(self) -> None:
         """
@@ -96,85 +158,49 @@ class VoucherListFilters:
 
         # Validate type
         if self.type is not None:
-            valid_types = ["DISCOUNT_PERCENTAGE", "DISCOUNT_FIXED"]
             type_upper = self.type.upper() if isinstance(self.type, str) else str(self.type)
-            if type_upper not in valid_types:
-                raise ValueError(f"type must be one of: {', '.join(valid_types)}")
+            if type_upper not in _VOUCHER_TYPE_SET:
+                raise ValueError(f"type must be one of: {', '.join(_VOUCHER_TYPES)}")
 
         # Validate client_type
         if self.client_type is not None:
-            valid_client_types = ["NEW_CUSTOMER", "RECURRING"]
             client_type_upper = self.client_type.upper() if isinstance(self.client_type, str) else str(self.client_type)
-            if client_type_upper not in valid_client_types:
+            if client_type_upper not in _CLIENT_TYPE_SET:
                 raise ValueError(
-                    f"client_type must be one of: {', '.join(valid_client_types)}"
+                    f"client_type must be one of: {', '.join(_CLIENT_TYPES)}"
                 )
 
         # Validate sort_by
         if self.sort_by is not None:
-            valid_sort_fields = [
-                "code",
-                "type",
-                "value",
-                "start_date",
-                "end_date",
-                "created_date",
-                "current_usage",
-                "usage_limit",
-                "min_purchase",
-            ]
             sort_by_lower = self.sort_by.lower() if isinstance(self.sort_by, str) else str(self.sort_by)
-            if sort_by_lower not in valid_sort_fields:
+            if sort_by_lower not in _SORT_FIELD_SET:
                 raise ValueError(
-                    f"sort_by must be one of: {', '.join(valid_sort_fields)}"
+                    f"sort_by must be one of: {', '.join(_SORT_FIELDS)}"
                 )
 
         # Validate sort_order
         if self.sort_order is not None:
-            valid_orders = ["asc", "desc"]
             sort_order_lower = self.sort_order.lower() if isinstance(self.sort_order, str) else str(self.sort_order)
-            if sort_order_lower not in valid_orders:
+            if sort_order_lower not in _SORT_ORDER_SET:
                 raise ValueError(
-                    f"sort_order must be one of: {', '.join(valid_orders)}"
+                    f"sort_order must be one of: {', '.join(_SORT_ORDERS)}"
                 )
 
         # Validate date formats (basic check)
-        date_fields = [
-            "start_date_from",
-            "start_date_to",
-            "end_date_from",
-            "end_date_to",
-        ]
-        for field in date_fields:
+        for field in _DATE_FIELDS:
             value = getattr(self, field)
-            if value:
-                try:
-                    from datetime import datetime
-
-                    datetime.strptime(value, "%Y-%m-%d")
-                except ValueError:
-                    raise ValueError(
-                        f"{field} must be in YYYY-MM-DD format, got: {value}"
-                    )
+            if value and not _is_valid_date(value):
+                raise ValueError(
+                    f"{field} must be in YYYY-MM-DD format, got: {value}"
+                )
 
         # Validate datetime formats (basic check)
-        datetime_fields = ["created_from", "created_to"]
-        for field in datetime_fields:
+        for field in _DATETIME_FIELDS:
             value = getattr(self, field)
-            if value:
-                try:
-                    from datetime import datetime
-
-                    # Try datetime format first
-                    try:
-                        datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
-                    except ValueError:
-                        # Fallback to date format
-                        datetime.strptime(value, "%Y-%m-%d")
-                except ValueError:
-                    raise ValueError(
-                        f"{field} must be in YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS format, got: {value}"
-                    )
+            if value and not _is_valid_date_or_datetime(value):
+                raise ValueError(
+                    f"{field} must be in YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS format, got: {value}"
+                )
 
         # Validate numeric ranges
         numeric_ranges = [
@@ -218,7 +244,8 @@ class VoucherValidationPayload:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, removing None values"""
-        return {k: v for k, v in asdict(self).items() if v is not None}
+        # Shallow: fields are primitives/JSON-ready, so skip asdict's deepcopy
+        return {k: v for k, v in self.__dict__.items() if v is not None}
 
     def validate(self) -> None:
         """
@@ -227,8 +254,6 @@ class VoucherValidationPayload:
         Raises:
             ValueError: If validation fails
         """
-        from ..utils.validators import validate_amount, validate_currency
-
         # Validate voucher_code
         if not self.voucher_code or not self.voucher_code.strip():
             raise ValueError("Voucher code cannot be empty")
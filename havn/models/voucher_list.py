@@ -5,6 +5,11 @@ Voucher list models for HAVN SDK
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass, field, fields
 
+from ..constants import HAVN_VOUCHER_PREFIX
+from .base import with_slots
+
+_HAVN_PREFIX_LEN = len(HAVN_VOUCHER_PREFIX)
+
 
 def is_havn_voucher_code(code: str) -> bool:
     """
@@ -26,7 +31,7 @@ def is_havn_voucher_code(code: str) -> bool:
         >>> is_havn_voucher_code("LOCAL123")
         False
         >>> is_havn_voucher_code("havn-test")
-        False  # Case sensitive for prefix check
+        True  # Prefix check is case-insensitive
     """
     # Early return for empty/invalid input (performance optimization)
     if not code:
@@ -34,10 +39,12 @@ def is_havn_voucher_code(code: str) -> bool:
     # Use isinstance check for type safety
     if not isinstance(code, str):
         return False
-    # Case-insensitive check (HAVN prefix is always uppercase)
-    return code.upper().startswith("HAVN-")
+    # Case-insensitive prefix check on the prefix slice only, so cost does not
+    # grow with code length (HAVN prefix is always uppercase)
+    return code[:_HAVN_PREFIX_LEN].upper() == HAVN_VOUCHER_PREFIX
 
 
+@with_slots
 @dataclass
 class VoucherData:
     """
@@ -120,12 +127,24 @@ class VoucherData:
         # Auto-detect HAVN voucher from code format
         code = voucher_data.get("code", "")
         voucher_data["is_havn_voucher"] = is_havn_voucher_code(code)
-        allowed_fields = {f.name for f in fields(cls)}
-        filtered_data = {k: v for k, v in voucher_data.items() if k in allowed_fields}
+        # Fast path: payload matches the schema exactly, so skip the filter copy
+        if (
+            "raw_response" not in voucher_data
+            and voucher_data.keys() <= _VOUCHER_DATA_FIELDS
+        ):
+            return cls(raw_response=voucher_data, **voucher_data)
+        filtered_data = {
+            k: v for k, v in voucher_data.items() if k in _VOUCHER_DATA_FIELDS
+        }
         filtered_data.setdefault("raw_response", voucher_data)
         return cls(**filtered_data)
 
 
+# Field names accepted by VoucherData.from_dict (computed once, not per voucher)
+_VOUCHER_DATA_FIELDS = frozenset(f.name for f in fields(VoucherData))
+
+
+@with_slots
 @dataclass
 class VoucherListPagination:
     """
@@ -149,10 +168,16 @@ class VoucherListPagination:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "VoucherListPagination":
-        """Create VoucherListPagination from dictionary"""
-        return cls(**data)
+        """Create VoucherListPagination from dictionary (unknown keys ignored)"""
+        if data.keys() <= _PAGINATION_FIELDS:
+            return cls(**data)
+        return cls(**{k: v for k, v in data.items() if k in _PAGINATION_FIELDS})
+
+
+_PAGINATION_FIELDS = frozenset(f.name for f in fields(VoucherListPagination))
 
 
+@with_slots
 @dataclass
 class VoucherListResponse:
     """
@@ -194,9 +219,8 @@ class VoucherListResponse:
         # Extract pagination (directly from root "pagination" key)
         pagination_dict = data.get("pagination")
 
-        # Convert vouchers using list comprehension (optimal performance)
-        # List comprehension is faster than map() or loops for this use case
-        vouchers = [VoucherData.from_dict(v) for v in vouchers_list]
+        # map() over the bound classmethod iterates in C (no per-item frame)
+        vouchers = list(map(VoucherData.from_dict, vouchers_list))
 
         # Lazy evaluation: only convert pagination if present (performance optimization)
         pagination = (
@@ -2,7 +2,13 @@
 Utility functions for HAVN SDK
 """
 
-from .auth import calculate_hmac_signature, build_auth_headers
+from .auth import (
+    calculate_hmac_signature,
+    build_auth_headers,
+    create_hmac_template,
+    serialize_payload,
+    sign_serialized_payload,
+)
 from .validators import validate_amount, validate_email, validate_currency
 from .currency import (
     CurrencyConverter,
@@ -15,6 +21,9 @@ from .currency import (
 __all__ = [
     "calculate_hmac_signature",
     "build_auth_headers",
+    "create_hmac_template",
+    "serialize_payload",
+    "sign_serialized_payload",
     "validate_amount",
     "validate_email",
     "validate_currency",
@@ -5,16 +5,75 @@ Authentication utilities for HAVN SDK
 import hmac
 import hashlib
 import json
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
+# Reused canonical encoder: json.dumps() with non-default options builds a
+# new JSONEncoder on every call. Output is byte-identical (sorted keys, no
+# spaces, ASCII-escaped), which the backend's signature check relies on.
+_CANONICAL_ENCODER = json.JSONEncoder(separators=(",", ":"), sort_keys=True)
 
-def calculate_hmac_signature(payload: Dict[str, Any], secret: str) -> str:
+
+def serialize_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize payload to the canonical JSON bytes used for signing
+
+    Sorted keys and no whitespace, matching the backend's signature check.
+    The same bytes are valid as the request body, so callers can serialize
+    once and reuse the result for both.
+
+    Args:
+        payload: Dictionary payload
+
+    Returns:
+        UTF-8 encoded canonical JSON
+
+    Example:
+        >>> serialize_payload({"b": 1, "a": 2})
+        b'{"a":2,"b":1}'
+    """
+    return _CANONICAL_ENCODER.encode(payload).encode("utf-8")
+
+
+def create_hmac_template(secret: str) -> "hmac.HMAC":
+    """
+    Create a keyed HMAC-SHA256 object to reuse for many signatures
+
+    The key schedule (ipad/opad derivation) is computed once here; each
+    signature then only needs a cheap `.copy()` plus the message update.
+
+    Args:
+        secret: Webhook secret key
+
+    Returns:
+        hmac.HMAC object keyed with the secret (no message absorbed)
+
+    Example:
+        >>> template = create_hmac_template("secret")
+        >>> signature = calculate_hmac_signature({"amount": 10000}, "secret", template)
+    """
+    return hmac.new(secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+@lru_cache(maxsize=32)
+def _cached_hmac_template(secret: str) -> "hmac.HMAC":
+    """Shared per-secret template for callers that don't pass one (copy before use)"""
+    return create_hmac_template(secret)
+
+
+def calculate_hmac_signature(
+    payload: Dict[str, Any],
+    secret: str,
+    hmac_template: Optional["hmac.HMAC"] = None,
+) -> str:
     """
     Calculate HMAC-SHA256 signature for webhook payload
 
     Args:
         payload: Dictionary payload to sign
         secret: Webhook secret key
+        hmac_template: Optional pre-keyed HMAC from `create_hmac_template(secret)`
+            (skips re-deriving the key schedule on every call)
 
     Returns:
         Hexadecimal signature string
@@ -24,14 +83,31 @@ def calculate_hmac_signature(payload: Dict[str, Any], secret: str) -> str:
         >>> signature = calculate_hmac_signature(payload, "secret")
     """
     # Serialize payload consistently (sorted keys, no spaces)
-    payload_str = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+    return sign_serialized_payload(serialize_payload(payload), secret, hmac_template)
 
-    # Calculate HMAC-SHA256
-    signature = hmac.new(
-        secret.encode("utf-8"), payload_str.encode("utf-8"), hashlib.sha256
-    ).hexdigest()
 
-    return signature
+def sign_serialized_payload(
+    payload_bytes: bytes,
+    secret: str,
+    hmac_template: Optional["hmac.HMAC"] = None,
+) -> str:
+    """
+    Calculate HMAC-SHA256 signature over already-serialized payload bytes
+
+    Args:
+        payload_bytes: Output of `serialize_payload(payload)`
+        secret: Webhook secret key
+        hmac_template: Optional pre-keyed HMAC from `create_hmac_template(secret)`.
+            When omitted, a template cached per secret is used instead.
+
+    Returns:
+        Hexadecimal signature string
+    """
+    if hmac_template is None:
+        hmac_template = _cached_hmac_template(secret)
+    mac = hmac_template.copy()
+    mac.update(payload_bytes)
+    return mac.hexdigest()
 
 
 def build_auth_headers(
@@ -39,6 +115,8 @@ def build_auth_headers(
     api_key: str = None,
     webhook_secret: str = None,
     content_type: str = "application/json",
+    hmac_template: Optional["hmac.HMAC"] = None,
+    serialized_payload: Optional[bytes] = None,
 ) -> Dict[str, str]:
     """
     Build authentication headers for API request
@@ -50,6 +128,10 @@ def build_auth_headers(
         payload: Request payload (optional, for GET requests can be None)
         api_key: API key
         webhook_secret: Webhook secret for signature
+        hmac_template: Optional pre-keyed HMAC for `webhook_secret`
+            (see `create_hmac_template`)
+        serialized_payload: Optional `serialize_payload(payload)` result, when the
+            caller already serialized the payload (e.g., for the request body)
 
     Returns:
         Dictionary of headers
@@ -72,8 +154,10 @@ def build_auth_headers(
     """
     # For GET requests, use empty dict for signature calculation
     # (matches backend behavior where request.get_data() returns empty bytes)
-    signature_payload = payload if payload is not None else {}
-    signature = calculate_hmac_signature(signature_payload, webhook_secret)
+    if serialized_payload is None:
+        signature_payload = payload if payload is not None else {}
+        serialized_payload = serialize_payload(signature_payload)
+    signature = sign_serialized_payload(serialized_payload, webhook_secret, hmac_template)
 
     return {
         "Content-Type": content_type,
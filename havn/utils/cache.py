@@ -0,0 +1,164 @@
+"""
+In-memory caching utilities for HAVN SDK
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with a fresh TTL and optional stale window
+
+    Entries younger than `ttl` are fresh. Entries older than `ttl` but younger
+    than `ttl + stale_ttl` are stale: they can still be served while the caller
+    refreshes them (stale-while-revalidate). Older entries are dropped.
+
+    Example:
+        >>> cache = TTLCache(ttl=30, stale_ttl=300)
+        >>> cache.set("key", True)
+        >>> cache.lookup("key")
+        (True, False)
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float = 0.0, maxsize: int = 1024):
+        """
+        Initialize cache
+
+        Args:
+            ttl: Seconds an entry stays fresh
+            stale_ttl: Extra seconds an expired entry may still be served as stale
+            maxsize: Maximum number of entries (oldest entries are evicted first)
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        # {key: (value, stored_at)} in insertion order for eviction
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, key: Hashable) -> Optional[Tuple[Any, bool]]:
+        """
+        Look up a cached value
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of (value, is_stale), or None if missing or expired
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            value, stored_at = entry
+            age = time.monotonic() - stored_at
+            if age < self.ttl:
+                return value, False
+            if age < self.ttl + self.stale_ttl:
+                return value, True
+
+            del self._data[key]
+            return None
+
+    def set(self, key: Hashable, value: Any, age: float = 0.0) -> None:
+        """
+        Store a value, evicting the oldest entry when full
+
+        Args:
+            key: Cache key
+            value: Value to store
+            age: Seconds the value has already been cached elsewhere (e.g., on
+                disk), so it expires on its original schedule
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (value, time.monotonic() - age)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def snapshot(self) -> List[Tuple[Hashable, Any, float]]:
+        """Return (key, value, age_seconds) for every fresh entry"""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                (key, value, now - stored_at)
+                for key, (value, stored_at) in self._data.items()
+                if now - stored_at < self.ttl
+            ]
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry (no-op if missing)"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution
+
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait for and share its result (or exception).
+
+    Example:
+        >>> flight = SingleFlight()
+        >>> flight.do("VOUCHER123", lambda: fetch("VOUCHER123"))
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` once per key across concurrent callers
+
+        Args:
+            key: Key identifying the call
+            fn: Zero-argument function to execute
+
+        Returns:
+            Result of `fn` (shared by all concurrent callers)
+
+        Raises:
+            Exception: Whatever `fn` raised, re-raised in every waiting caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Return True if a call for `key` is currently running"""
+        with self._lock:
+            return key in self._calls
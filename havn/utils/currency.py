@@ -5,14 +5,21 @@ Handles currency conversion with exchange rate caching and error handling.
 All amounts in HAVN are stored in USD cents (single source of truth).
 """
 
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
 import warnings
+from functools import lru_cache
 
 import requests
-from decimal import Decimal, ROUND_HALF_UP
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from ..config import Config
 from ..constants import USD_CURRENCY
+from .cache import SingleFlight, TTLCache
 
 # Minor unit mapping (number of decimal places for each currency)
 _CURRENCY_MINOR_UNITS = {
@@ -32,6 +39,55 @@ _CURRENCY_MINOR_UNITS = {
 }
 _DEFAULT_MINOR_UNIT = 2
 
+# Display symbols for formatted amounts (unknown currencies use their code)
+_CURRENCY_SYMBOLS = {
+    "USD": "$",
+    "EUR": "€",
+    "GBP": "£",
+    "JPY": "¥",
+    "IDR": "Rp",
+    "INR": "₹",
+    "CNY": "¥",
+    "KRW": "₩",
+    "SGD": "S$",
+    "MYR": "RM",
+    "THB": "฿",
+    "PHP": "₱",
+    "VND": "₫",
+}
+
+# Process-wide rate tables shared by converters with the same source and TTL
+_RATE_CACHE_MAXSIZE = 256
+_shared_rate_caches: Dict[Tuple[str, float], TTLCache] = {}
+_shared_rate_caches_lock = threading.Lock()
+# Coalesces concurrent cache misses for the same (API URL, currency)
+_rate_fetches = SingleFlight()
+
+
+def _get_shared_rate_cache(api_url: str, ttl_seconds: float) -> TTLCache:
+    """Return the process-wide rate cache for an API URL and TTL (DRY helper)"""
+    key = (api_url, ttl_seconds)
+    with _shared_rate_caches_lock:
+        cache = _shared_rate_caches.get(key)
+        if cache is None:
+            cache = TTLCache(ttl=ttl_seconds, maxsize=_RATE_CACHE_MAXSIZE)
+            _shared_rate_caches[key] = cache
+        return cache
+
+
+@lru_cache(maxsize=256)
+def _normalize_currency(code: str) -> str:
+    """
+    Uppercase, strip and validate a currency code (memoized per raw input)
+
+    Raises:
+        ValueError: If the code is not 3 letters
+    """
+    normalized = code.upper().strip()
+    if len(normalized) != 3 or not normalized.isalpha():
+        raise ValueError(f"Invalid currency code: {normalized}")
+    return normalized
+
 
 class CurrencyConverter:
     """
@@ -51,12 +107,14 @@ class CurrencyConverter:
     DEFAULT_EXCHANGE_RATE_API_URL = "https://api.exchangerate-api.com/v4/latest/USD"
     DEFAULT_CACHE_DURATION_HOURS = 24  # Cache rates for 24 hours
     DEFAULT_API_TIMEOUT = 5  # API request timeout in seconds
+    MISSING_RATE_CACHE_SECONDS = 300  # Remember unsupported currencies briefly
 
     def __init__(
         self,
         exchange_rate_api_url: Optional[str] = None,
         cache_duration_hours: Optional[int] = None,
         api_timeout: Optional[int] = None,
+        cache_file: Optional[str] = None,
     ):
         """
         Initialize currency converter
@@ -65,6 +123,8 @@ class CurrencyConverter:
             exchange_rate_api_url: Exchange rate API URL (default from config or env)
             cache_duration_hours: Cache duration in hours (default: 24)
             api_timeout: API request timeout in seconds (default: 5)
+            cache_file: JSON file to persist fetched rates across restarts
+                (default from env `HAVN_EXCHANGE_RATE_CACHE_FILE`, None = memory only)
         """
         self.exchange_rate_api_url = (
             exchange_rate_api_url
@@ -80,8 +140,22 @@ class CurrencyConverter:
             api_timeout or Config.get_currency_api_timeout() or self.DEFAULT_API_TIMEOUT
         )
 
-        # In-memory cache: {currency: {"rate": Decimal, "fetched_at": datetime}}
-        self._rate_cache: Dict[str, Dict[str, Any]] = {}
+        # In-memory cache {currency: Decimal rate}, shared with every converter
+        # using the same API URL and cache duration
+        self._rate_cache = _get_shared_rate_cache(
+            self.exchange_rate_api_url, self.cache_duration_hours * 3600
+        )
+
+        # Currencies the API answered without a usable rate; network failures
+        # are not recorded so they are retried on the next call
+        self._missing_rates = TTLCache(
+            ttl=self.MISSING_RATE_CACHE_SECONDS, maxsize=_RATE_CACHE_MAXSIZE
+        )
+
+        # Optional on-disk copy so short-lived processes start warm
+        self.cache_file = cache_file or Config.get_exchange_rate_cache_file()
+        if self.cache_file:
+            self._load_cache_file()
 
     @staticmethod
     def _get_minor_unit(currency: str) -> int:
@@ -104,14 +178,9 @@ class CurrencyConverter:
         Raises:
             ValueError: If currency code is invalid
         """
-        to_currency = to_currency.upper().strip()
-        from_currency = from_currency.upper().strip()
-
-        # Validate currency codes
-        if len(to_currency) != 3 or not to_currency.isalpha():
-            raise ValueError(f"Invalid currency code: {to_currency}")
-        if len(from_currency) != 3 or not from_currency.isalpha():
-            raise ValueError(f"Invalid currency code: {from_currency}")
+        # Normalize and validate currency codes
+        to_currency = _normalize_currency(to_currency)
+        from_currency = _normalize_currency(from_currency)
 
         # Same currency, return 1.0
         if from_currency == to_currency:
@@ -124,7 +193,7 @@ class CurrencyConverter:
         # For other currency -> USD (inverse)
         if to_currency == self.BASE_CURRENCY:
             rate = self._get_rate_from_usd(from_currency)
-            if rate:
+            if rate is not None:
                 # Inverse: 1 / rate (1 IDR = 1/USD_rate USD)
                 return Decimal("1.0") / rate
             return None
@@ -134,13 +203,37 @@ class CurrencyConverter:
         from_rate = self._get_rate_from_usd(from_currency)
         to_rate = self._get_rate_from_usd(to_currency)
 
-        if from_rate and to_rate:
+        if from_rate is not None and to_rate is not None:
             # Rate = to_rate / from_rate
             # Example: IDR -> EUR = EUR_rate / IDR_rate
             return to_rate / from_rate
 
         return None
 
+    async def aget_exchange_rate(
+        self, to_currency: str, from_currency: str = BASE_CURRENCY
+    ) -> Optional[Decimal]:
+        """
+        Awaitable `get_exchange_rate` that does not block the event loop
+
+        Cache misses fetch on the loop's default executor, the same approach
+        as `HAVNAsyncClient`, so no async HTTP dependency is needed.
+
+        Args:
+            to_currency: Target currency code (e.g., "IDR", "EUR")
+            from_currency: Source currency code (default: "USD")
+
+        Returns:
+            Exchange rate as Decimal, or None if not available
+
+        Raises:
+            ValueError: If currency code is invalid
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.get_exchange_rate, to_currency, from_currency
+        )
+
     def _get_rate_from_usd(self, currency: str) -> Optional[Decimal]:
         """
         Get exchange rate from USD to target currency (with caching)
@@ -152,41 +245,106 @@ class CurrencyConverter:
             Exchange rate as Decimal, or None if not available
         """
         # Check cache first
-        if currency in self._rate_cache:
-            cached = self._rate_cache[currency]
-            fetched_at = cached["fetched_at"]
-            cache_expires_at = fetched_at + timedelta(hours=self.cache_duration_hours)
-
-            if datetime.now() < cache_expires_at:
-                # Cache is still valid - validate rate before returning
-                cached_rate = cached["rate"]
-                if self._validate_exchange_rate(currency, cached_rate):
-                    return cached_rate
-                else:
-                    # Invalid cached rate, remove from cache and fetch fresh
-                    import logging
+        cached = self._rate_cache.lookup(currency)
+        if cached is not None:
+            # Cache is still valid - validate rate before returning
+            cached_rate, _ = cached
+            if self._validate_exchange_rate(currency, cached_rate):
+                return cached_rate
+            else:
+                # Invalid cached rate, remove from cache and fetch fresh
+                import logging
+
+                logging.warning(
+                    f"Invalid cached exchange rate for {currency}: {cached_rate}. "
+                    "Removing from cache and fetching fresh rate.",
+                    extra={
+                        "currency": currency,
+                        "cached_rate": float(cached_rate),
+                    },
+                )
+                self._rate_cache.invalidate(currency)
+
+        # Known-unsupported currency: don't refetch until the negative entry expires
+        if self._missing_rates.lookup(currency) is not None:
+            return None
 
-                    logging.warning(
-                        f"Invalid cached exchange rate for {currency}: {cached_rate}. "
-                        "Removing from cache and fetching fresh rate.",
-                        extra={
-                            "currency": currency,
-                            "cached_rate": float(cached_rate),
-                        },
-                    )
-                    del self._rate_cache[currency]
+        # Cache expired or not found: fetch from API, one request per currency
+        # even when several threads miss at the same time
+        return _rate_fetches.do(
+            (self.exchange_rate_api_url, currency),
+            lambda: self._fetch_and_cache_rate(currency),
+        )
+
+    def _fetch_and_cache_rate(self, currency: str) -> Optional[Decimal]:
+        """Fetch a rate from the API and cache it (single-flight leader only)"""
+        # Re-check: a flight that just finished may already have filled it
+        cached = self._rate_cache.lookup(currency)
+        if cached is not None:
+            return cached[0]
 
-        # Cache expired or not found, fetch from API
         rate = self._fetch_exchange_rate_from_api(currency)
-        if rate:
+        if rate is not None:
             # Update cache only if rate is valid (already validated in _fetch_exchange_rate_from_api)
-            self._rate_cache[currency] = {
-                "rate": rate,
-                "fetched_at": datetime.now(),
-            }
+            self._rate_cache.set(currency, rate)
+            if self.cache_file:
+                self._save_cache_file()
 
         return rate
 
+    def _load_cache_file(self) -> None:
+        """Seed the rate cache from `cache_file`, skipping expired or invalid rates"""
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                entries = json.load(f)["rates"]
+            now = time.time()
+            for code, entry in entries.items():
+                age = now - float(entry["fetched_at"])
+                rate = Decimal(entry["rate"])
+                if 0 <= age < self._rate_cache.ttl and self._validate_exchange_rate(
+                    code, rate
+                ):
+                    self._rate_cache.set(code, rate, age=age)
+        except FileNotFoundError:
+            return
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            TypeError,
+            AttributeError,
+            InvalidOperation,
+        ) as e:
+            import logging
+
+            logging.warning(
+                f"Ignoring unreadable exchange rate cache file {self.cache_file}: {e}"
+            )
+
+    def _save_cache_file(self) -> None:
+        """Write fresh cached rates to `cache_file` atomically (temp file + rename)"""
+        now = time.time()
+        entries = {
+            code: {"rate": str(rate), "fetched_at": now - age}
+            for code, rate, age in self._rate_cache.snapshot()
+        }
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"rates": entries}, f)
+                os.replace(tmp_path, self.cache_file)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            import logging
+
+            logging.warning(
+                f"Failed to write exchange rate cache file {self.cache_file}: {e}"
+            )
+
     def _fetch_exchange_rate_from_api(self, currency: str) -> Optional[Decimal]:
         """
         Fetch exchange rate from external API
@@ -212,6 +370,10 @@ class CurrencyConverter:
             # OR: {"data": {"rates": {...}}} (different API formats)
             rates_data = data.get("rates") or data.get("data", {}).get("rates", {})
 
+            # The response carries every rate: cache the others now so later
+            # lookups for other currencies don't refetch the same payload
+            self._cache_rates(rates_data, skip=currency)
+
             if currency in rates_data:
                 rate_value = rates_data[currency]
                 rate = Decimal(str(rate_value))
@@ -232,6 +394,7 @@ class CurrencyConverter:
                             else "data.rates",
                         },
                     )
+                    self._missing_rates.set(currency, True)
                     return None
 
                 return rate
@@ -249,6 +412,7 @@ class CurrencyConverter:
                     "api_url": self.exchange_rate_api_url,
                 },
             )
+            self._missing_rates.set(currency, True)
             return None
 
         except (requests.exceptions.RequestException, KeyError, ValueError) as e:
@@ -261,6 +425,24 @@ class CurrencyConverter:
             )
             return None
 
+    def _cache_rates(self, rates_data: Dict[str, Any], skip: str) -> None:
+        """
+        Cache every valid rate from an API response
+
+        Args:
+            rates_data: Mapping of currency code to rate from the API response
+            skip: Currency handled by the caller (validated and cached there)
+        """
+        for code, rate_value in rates_data.items():
+            if code == skip or not isinstance(code, str):
+                continue
+            try:
+                rate = Decimal(str(rate_value))
+            except (InvalidOperation, ValueError):
+                continue
+            if self._validate_exchange_rate(code, rate):
+                self._rate_cache.set(code.upper(), rate)
+
     def _validate_exchange_rate(self, currency: str, rate: Decimal) -> bool:
         """
         Validate exchange rate is within reasonable range
@@ -306,11 +488,11 @@ class CurrencyConverter:
         Raises:
             ValueError: If currency is invalid or exchange rate not available
         """
-        from_currency = from_currency.upper().strip()
+        from_currency = _normalize_currency(from_currency)
 
         # Get exchange rate (from_currency -> USD)
         rate = self.get_exchange_rate(self.BASE_CURRENCY, from_currency)
-        if not rate:
+        if rate is None:
             raise ValueError(
                 f"Exchange rate not available for {from_currency} to USD. "
                 "Please ensure the currency is supported and API is accessible."
@@ -342,6 +524,45 @@ class CurrencyConverter:
             "original_currency": from_currency,
         }
 
+    def convert_many_to_usd_cents(
+        self, amounts: Sequence[int], from_currency: str
+    ) -> List[int]:
+        """
+        Convert many amounts in one currency to USD cents
+
+        The exchange rate and minor-unit scale are resolved once for the whole
+        batch, so each amount costs a single multiply and rounding step. Results
+        match `convert_to_usd_cents(amount, from_currency)["amount_cents"]`.
+
+        Args:
+            amounts: Amounts in source currency's smallest unit
+            from_currency: Source currency code (e.g., "IDR", "EUR")
+
+        Returns:
+            List of amounts in USD cents, in input order
+
+        Raises:
+            ValueError: If currency is invalid or exchange rate not available
+        """
+        from_currency = _normalize_currency(from_currency)
+
+        rate = self.get_exchange_rate(self.BASE_CURRENCY, from_currency)
+        if rate is None:
+            raise ValueError(
+                f"Exchange rate not available for {from_currency} to USD. "
+                "Please ensure the currency is supported and API is accessible."
+            )
+
+        # minor units -> major units -> USD -> USD cents, folded into one factor
+        scale = Decimal("10") ** self._get_minor_unit(from_currency)
+        factor = rate * Decimal("100") / scale
+        one = Decimal("1")
+
+        return [
+            int((Decimal(amount) * factor).quantize(one, rounding=ROUND_HALF_UP))
+            for amount in amounts
+        ]
+
     def convert_from_usd_cents(
         self, amount_cents: int, to_currency: str
     ) -> Dict[str, Any]:
@@ -365,11 +586,11 @@ class CurrencyConverter:
         Raises:
             ValueError: If currency is invalid or exchange rate not available
         """
-        to_currency = to_currency.upper().strip()
+        to_currency = _normalize_currency(to_currency)
 
         # Get exchange rate (USD -> to_currency)
         rate = self.get_exchange_rate(to_currency, self.BASE_CURRENCY)
-        if not rate:
+        if rate is None:
             raise ValueError(
                 f"Exchange rate not available for USD to {to_currency}. "
                 "Please ensure the currency is supported and API is accessible."
@@ -413,23 +634,7 @@ class CurrencyConverter:
         Returns:
             Formatted string (e.g., "$10.00", "Rp 150.000")
         """
-        currency_symbols = {
-            "USD": "$",
-            "EUR": "€",
-            "GBP": "£",
-            "JPY": "¥",
-            "IDR": "Rp",
-            "INR": "₹",
-            "CNY": "¥",
-            "KRW": "₩",
-            "SGD": "S$",
-            "MYR": "RM",
-            "THB": "฿",
-            "PHP": "₱",
-            "VND": "₫",
-        }
-
-        symbol = currency_symbols.get(currency, currency)
+        symbol = _CURRENCY_SYMBOLS.get(currency, currency)
         minor_unit = self._get_minor_unit(currency)
 
         if minor_unit == 0:
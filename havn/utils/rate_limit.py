@@ -0,0 +1,109 @@
+"""
+Client-side rate limiting for HAVN SDK
+"""
+
+import math
+import threading
+import time
+from typing import Optional
+
+from ..constants import DEFAULT_RATE_LIMIT_COOLDOWN, DEFAULT_RATE_LIMIT_MESSAGE
+from ..exceptions import HAVNRateLimitError
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that also honors server rate-limit windows
+
+    Two independent gates run before every request:
+
+    - Local pacing (optional): at most `rate` requests per second with bursts
+      of up to `burst`; callers wait for a token instead of hitting the API.
+    - Server window: once the API reports the window is exhausted
+      (`X-RateLimit-Remaining: 0`, or a 429 with `Retry-After` /
+      `X-RateLimit-Reset`), requests fail fast with HAVNRateLimitError until
+      the window resets, saving a round trip that would only return 429.
+
+    Example:
+        >>> bucket = TokenBucket(rate=10, burst=20)
+        >>> bucket.acquire()  # Waits if more than 20 calls in a burst
+        >>> bucket.update(remaining=0, reset_after=30)
+        >>> bucket.acquire()  # Raises HAVNRateLimitError (retry_after=30)
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None):
+        """
+        Initialize token bucket
+
+        Args:
+            rate: Requests per second allowed locally (None = no local pacing)
+            burst: Maximum tokens that can accumulate (default: ceil(rate))
+        """
+        self.rate = rate if rate and rate > 0 else None
+        self.burst = (burst or max(1, math.ceil(self.rate))) if self.rate else None
+        self._tokens = float(self.burst) if self.rate else 0.0
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Take one token, waiting for local pacing if needed
+
+        Raises:
+            HAVNRateLimitError: If the server window is exhausted
+        """
+        with self._lock:
+            now = time.monotonic()
+            blocked_for = self._blocked_until - now
+            if blocked_for > 0:
+                raise HAVNRateLimitError(
+                    message=DEFAULT_RATE_LIMIT_MESSAGE,
+                    retry_after=math.ceil(blocked_for),
+                )
+
+            if self.rate is None:
+                return
+
+            # Refill, then reserve a token (may go negative -> wait outside lock)
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def update(
+        self,
+        remaining: Optional[int] = None,
+        reset_after: Optional[float] = None,
+        limited: bool = False,
+    ) -> None:
+        """
+        Record rate-limit state reported by the server
+
+        Args:
+            remaining: Requests left in the current window (X-RateLimit-Remaining)
+            reset_after: Seconds until the window resets (Retry-After / X-RateLimit-Reset)
+            limited: True when the response itself was a 429
+        """
+        if not limited and remaining != 0:
+            return
+
+        if reset_after is None:
+            # 429 without timing info: back off briefly rather than hammering
+            if not limited:
+                return
+            reset_after = DEFAULT_RATE_LIMIT_COOLDOWN
+
+        with self._lock:
+            self._blocked_until = max(
+                self._blocked_until, time.monotonic() + reset_after
+            )
+
+    def reset(self) -> None:
+        """Forget any server-reported block"""
+        with self._lock:
+            self._blocked_until = 0.0
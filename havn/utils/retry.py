@@ -0,0 +1,82 @@
+"""
+Retry policy for HAVN SDK HTTP sessions
+"""
+
+import random
+import time
+from typing import Optional
+
+from urllib3.util.retry import Retry
+
+from ..constants import HEADER_RATE_LIMIT_RESET, HTTP_STATUS_TOO_MANY_REQUESTS
+
+# Fraction of the exponential backoff added as random jitter
+_BACKOFF_JITTER_RATIO = 0.25
+# Statuses where X-RateLimit-Reset means "retry after the window resets";
+# on other 5xx it only describes the rate window, not the outage
+_RATE_LIMIT_RESET_STATUSES = frozenset({HTTP_STATUS_TOO_MANY_REQUESTS, 503})
+
+
+class HAVNRetry(Retry):
+    """
+    urllib3 Retry that understands HAVN rate-limit headers
+
+    - `X-RateLimit-Reset` (epoch seconds) is honored like `Retry-After` on
+      429/503 responses; other 5xx use the normal jittered backoff.
+    - Exponential backoff gets up to 25% random jitter, so many clients
+      retrying after the same outage do not hit the API in lockstep.
+    - Server-requested waits are capped at `max_retry_after` seconds.
+    - 429 is never retried here (not even with `Retry-After`): the client's
+      rate limiter raises HAVNRateLimitError instead of sleeping in urllib3.
+
+    Example:
+        >>> retry = HAVNRetry(total=3, backoff_factor=0.5, max_retry_after=30)
+        >>> adapter = HTTPAdapter(max_retries=retry)
+    """
+
+    # urllib3 default is {413, 429, 503}; 413 is not transient and 429 is
+    # handled by TokenBucket
+    RETRY_AFTER_STATUS_CODES = frozenset({503})
+
+    def __init__(self, *args, max_retry_after: Optional[float] = None, **kwargs):
+        """
+        Initialize retry policy
+
+        Args:
+            *args: Positional arguments for urllib3 Retry
+            max_retry_after: Upper bound in seconds for server-requested waits
+                (None = no cap)
+            **kwargs: Keyword arguments for urllib3 Retry
+        """
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kw) -> "HAVNRetry":
+        # urllib3 rebuilds the policy after every attempt; keep our setting
+        kw.setdefault("max_retry_after", self.max_retry_after)
+        return super().new(**kw)
+
+    def get_retry_after(self, response) -> Optional[float]:
+        """Seconds to wait from X-RateLimit-Reset (429/503), falling back to Retry-After"""
+        reset = response.headers.get(HEADER_RATE_LIMIT_RESET)
+        if reset and response.status in _RATE_LIMIT_RESET_STATUSES:
+            try:
+                return max(0.0, float(int(reset) - int(time.time())))
+            except (ValueError, TypeError):
+                pass
+        return super().get_retry_after(response)
+
+    def sleep_for_retry(self, response) -> bool:
+        retry_after = self.get_retry_after(response)
+        if not retry_after:
+            return False
+        if self.max_retry_after is not None:
+            retry_after = min(retry_after, self.max_retry_after)
+        time.sleep(retry_after)
+        return True
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        if backoff <= 0:
+            return backoff
+        return backoff + random.uniform(0, _BACKOFF_JITTER_RATIO * backoff)
@@ -0,0 +1,37 @@
+"""
+JSON serialization helpers for HAVN SDK
+
+Uses msgspec when it is installed (``pip install havn-sdk[speedups]``) and
+falls back to the standard library otherwise, so behavior is identical with
+or without the optional dependency.
+"""
+
+from typing import Any
+
+import requests
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - optional dependency
+    msgspec = None
+
+
+def decode_json_response(response: requests.Response) -> Any:
+    """
+    Decode a JSON response body
+
+    Args:
+        response: requests.Response object
+
+    Returns:
+        Decoded JSON value
+
+    Raises:
+        ValueError: If the body is empty or not valid JSON
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(response.content)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    return response.json()
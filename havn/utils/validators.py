@@ -5,6 +5,42 @@ Validation utilities for HAVN SDK
 import re
 from typing import Optional
 
+# Simple email regex (RFC 5322 simplified), compiled once at import
+_EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+# Maximum email address length (RFC 5321 forward-path limit)
+_MAX_EMAIL_LENGTH = 254
+
+# Common currency codes (can be extended)
+SUPPORTED_CURRENCIES = (
+    "USD",
+    "EUR",
+    "GBP",
+    "JPY",
+    "CNY",
+    "AUD",
+    "CAD",
+    "CHF",
+    "HKD",
+    "SGD",
+    "SEK",
+    "NOK",
+    "DKK",
+    "INR",
+    "IDR",
+    "MYR",
+    "PHP",
+    "THB",
+    "VND",
+    "KRW",
+    "TWD",
+    "BRL",
+    "MXN",
+    "ZAR",
+    "TRY",
+    "RUB",
+)
+_SUPPORTED_CURRENCY_SET = frozenset(SUPPORTED_CURRENCIES)
+
 
 def validate_amount(amount: int) -> None:
     """
@@ -47,10 +83,12 @@ def validate_email(email: str) -> None:
     if not isinstance(email, str):
         raise ValueError("Email must be a string")
 
-    # Simple email regex (RFC 5322 simplified)
-    pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-
-    if not re.match(pattern, email):
+    # Cheap checks first: obviously invalid input never reaches the regex
+    if (
+        "@" not in email
+        or len(email) > _MAX_EMAIL_LENGTH
+        or not _EMAIL_PATTERN.match(email)
+    ):
         raise ValueError(f"Invalid email format: {email}")
 
 
@@ -77,40 +115,10 @@ def validate_currency(currency: str) -> None:
     if not currency.isupper():
         raise ValueError("Currency code must be uppercase")
 
-    # Common currency codes (can be extended)
-    valid_currencies = [
-        "USD",
-        "EUR",
-        "GBP",
-        "JPY",
-        "CNY",
-        "AUD",
-        "CAD",
-        "CHF",
-        "HKD",
-        "SGD",
-        "SEK",
-        "NOK",
-        "DKK",
-        "INR",
-        "IDR",
-        "MYR",
-        "PHP",
-        "THB",
-        "VND",
-        "KRW",
-        "TWD",
-        "BRL",
-        "MXN",
-        "ZAR",
-        "TRY",
-        "RUB",
-    ]
-
-    if currency not in valid_currencies:
+    if currency not in _SUPPORTED_CURRENCY_SET:
         raise ValueError(
             f"Unsupported currency code: {currency}. "
-            f"Supported: {', '.join(valid_currencies)}"
+            f"Supported: {', '.join(SUPPORTED_CURRENCIES)}"
         )
 
 
@@ -2,7 +2,6 @@
 Auth webhook handler for SaaS company login
 """
 
-from typing import Optional
 from ..exceptions import HAVNValidationError
 
 
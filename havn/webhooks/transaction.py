@@ -2,10 +2,25 @@
 Transaction webhook handler
 """
 
-from typing import Dict, Any, Optional
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Union
+from ..config import Config
+from ..constants import HEADER_IDEMPOTENCY_KEY, HTTP_STATUS_NOT_FOUND
 from ..models.transaction import TransactionPayload, TransactionResponse
 from ..models.voucher_list import is_havn_voucher_code
-from ..exceptions import HAVNValidationError
+from ..exceptions import HAVNAPIError, HAVNError, HAVNValidationError
+from ..utils.auth import serialize_payload
+from ..utils.cache import SingleFlight, TTLCache
+
+
+# Default transactions per batch request
+DEFAULT_BATCH_CHUNK_SIZE = 500
+
+
+def _idempotency_key(payload: Dict[str, Any]) -> str:
+    """Derive a stable Idempotency-Key from the canonical payload bytes"""
+    return hashlib.sha256(serialize_payload(payload)).hexdigest()[:32]
 
 
 class TransactionWebhook:
@@ -31,6 +46,19 @@ class TransactionWebhook:
             client: HAVNClient instance
         """
         self.client = client
+        # Successful responses by idempotency key, so a retried send of the
+        # same transaction is answered locally instead of re-POSTed
+        self._sent_cache = TTLCache(
+            ttl=Config.DEFAULT_IDEMPOTENCY_CACHE_TTL,
+            maxsize=Config.DEFAULT_IDEMPOTENCY_CACHE_MAXSIZE,
+        )
+        self._inflight = SingleFlight()
+        # Whether the backend has the batch endpoint (None = not probed yet)
+        self._batch_supported: Optional[bool] = None
+
+    def clear_cache(self) -> None:
+        """Forget previously sent transactions (next send always hits the API)"""
+        self._sent_cache.clear()
 
     def send(
         self,
@@ -57,6 +85,12 @@ class TransactionWebhook:
         it will NOT be sent to HAVN API. Only referral_code will be sent.
         Local vouchers should be handled separately by SaaS company.
 
+        **Idempotency:**
+        - Each request carries an `Idempotency-Key` derived from the payload, so
+          retries of the same transaction are safe on the backend.
+        - A successful response is remembered for 10 minutes; sending the identical
+          transaction again returns it without a new POST (`clear_cache()` resets).
+
         **Currency Conversion:**
         - HAVN backend is the single source of truth for currency conversion.
         - SDK forwards the amount exactly as provided and relies on backend conversion
@@ -132,6 +166,64 @@ class TransactionWebhook:
             >>>
             >>> # Customer type is auto-determined by HAVN backend. No manual flag needed.
         """
+        payload_dict = self._build_payload(
+            amount,
+            payment_gateway_transaction_id,
+            payment_gateway=payment_gateway,
+            customer_email=customer_email,
+            referral_code=referral_code,
+            promo_code=promo_code,
+            currency=currency,
+            customer_type=customer_type,
+            subtotal_transaction=subtotal_transaction,
+            custom_fields=custom_fields,
+            invoice_id=invoice_id,
+            transaction_type=transaction_type,
+            description=description,
+            server_side_conversion=server_side_conversion,
+        )
+        idempotency_key = _idempotency_key(payload_dict)
+
+        # Identical transaction already accepted: replay the response locally
+        cached = self._sent_cache.lookup(idempotency_key)
+        if cached is not None:
+            return cached[0]
+
+        # Concurrent sends of the same transaction share one request
+        return self._inflight.do(
+            idempotency_key,
+            lambda: self._post_transaction(payload_dict, idempotency_key),
+        )
+
+    def _build_payload(
+        self,
+        amount: int,
+        payment_gateway_transaction_id: str,
+        *,
+        payment_gateway: str,
+        customer_email: str,
+        referral_code: str,
+        promo_code: Optional[str] = None,
+        currency: str = "USD",
+        customer_type: Optional[str] = None,
+        subtotal_transaction: Optional[int] = None,
+        custom_fields: Optional[Dict[str, Any]] = None,
+        invoice_id: Optional[str] = None,
+        transaction_type: Optional[str] = None,
+        description: Optional[str] = None,
+        server_side_conversion: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Build and validate the API payload for one transaction
+
+        Takes the same arguments as `send()`.
+
+        Returns:
+            Payload dictionary ready to sign and send
+
+        Raises:
+            HAVNValidationError: If payload validation fails
+        """
         if not payment_gateway or not payment_gateway.strip():
             raise HAVNValidationError(
                 "payment_gateway is required and cannot be empty"
@@ -191,12 +283,190 @@ class TransactionWebhook:
         except ValueError as e:
             raise HAVNValidationError(str(e))
 
-        # Make API request
+        return payload.to_dict()
+
+    def _post_transaction(
+        self, payload: Dict[str, Any], idempotency_key: str
+    ) -> TransactionResponse:
+        """POST transaction with Idempotency-Key and remember successful responses"""
+        # Make API request (urllib3 retries resend the same key)
         response_data = self.client._make_request(
             method="POST",
             endpoint="/api/v1/webhook/transaction",
-            payload=payload.to_dict(),
+            payload=payload,
+            extra_headers={HEADER_IDEMPOTENCY_KEY: idempotency_key},
         )
 
         # Parse response
-        return TransactionResponse.from_dict(response_data)
+        result = TransactionResponse.from_dict(response_data)
+        if result.success:
+            self._sent_cache.set(idempotency_key, result)
+        return result
+
+    def send_many(
+        self,
+        transactions: List[Dict[str, Any]],
+        max_workers: int = 8,
+    ) -> List[Union[TransactionResponse, HAVNError]]:
+        """
+        Send multiple transactions concurrently
+
+        Each entry is a dict of keyword arguments accepted by `send()`. Requests
+        run on a thread pool and share the client's keep-alive connection pool,
+        so total latency is roughly one round trip per `max_workers` transactions
+        instead of one per transaction.
+
+        A failing transaction does not abort the batch: its HAVNError is returned
+        in place of the response, in the same position as the input.
+
+        Args:
+            transactions: List of `send()` keyword-argument dicts
+            max_workers: Maximum concurrent requests (default: 8), capped at
+                the client's `pool_maxsize`
+
+        Returns:
+            List of TransactionResponse or HAVNError, in input order
+
+        Example:
+            >>> results = client.transactions.send_many([
+            ...     {"amount": 5000, "payment_gateway_transaction_id": "stripe_001",
+            ...      "payment_gateway": "STRIPE", "customer_email": "a@example.com",
+            ...      "referral_code": "HAVN-MJ-001"},
+            ... ])
+            >>> for result in results:
+            ...     if isinstance(result, HAVNError):
+            ...         print(f"Failed: {result}")
+        """
+        if not transactions:
+            return []
+
+        def _send_one(kwargs: Dict[str, Any]) -> Union[TransactionResponse, HAVNError]:
+            try:
+                return self.send(**kwargs)
+            except HAVNError as e:
+                return e
+
+        # More workers than pooled connections would just churn short-lived sockets
+        workers = max(1, min(max_workers, self.client.pool_maxsize, len(transactions)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_send_one, transactions))
+
+    def send_batch(
+        self,
+        transactions: List[Dict[str, Any]],
+        chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE,
+    ) -> List[Union[TransactionResponse, HAVNError]]:
+        """
+        Send multiple transactions in as few requests as possible
+
+        Transactions are POSTed in chunks of `chunk_size` to the batch endpoint,
+        so signing, TLS and response parsing happen once per chunk instead of
+        once per transaction. If the backend has no batch endpoint (404), the
+        SDK remembers that and falls back to `send_many()`.
+
+        Results follow the same rules as `send_many()`: one entry per input, in
+        input order, with HAVNError in place of a failed transaction. If a whole
+        chunk fails (network error, rate limit, non-404 API error), that error
+        fills every entry of the chunk; results of other chunks are kept.
+        Already sent transactions are answered from the idempotency cache.
+
+        Args:
+            transactions: List of `send()` keyword-argument dicts
+            chunk_size: Maximum transactions per request (default: 500)
+
+        Returns:
+            List of TransactionResponse or HAVNError, in input order
+
+        Raises:
+            ValueError: If chunk_size is less than 1
+
+        Example:
+            >>> results = client.transactions.send_batch(daily_transactions)
+            >>> failed = [r for r in results if isinstance(r, HAVNError)]
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        results: List[Union[TransactionResponse, HAVNError]] = []
+        for start in range(0, len(transactions), chunk_size):
+            chunk = transactions[start : start + chunk_size]
+            if self._batch_supported is False:
+                results.extend(self.send_many(chunk))
+            else:
+                results.extend(self._send_chunk(chunk))
+        return results
+
+    def _send_chunk(
+        self, transactions: List[Dict[str, Any]]
+    ) -> List[Union[TransactionResponse, HAVNError]]:
+        """Send one chunk through the batch endpoint (or send_many on 404)"""
+        results: List[Optional[Union[TransactionResponse, HAVNError]]] = [
+            None
+        ] * len(transactions)
+        pending: List[int] = []
+        payloads: List[Dict[str, Any]] = []
+        keys: List[str] = []
+
+        for index, kwargs in enumerate(transactions):
+            try:
+                payload = self._build_payload(**kwargs)
+            except HAVNError as e:
+                results[index] = e
+                continue
+
+            key = _idempotency_key(payload)
+            cached = self._sent_cache.lookup(key)
+            if cached is not None:
+                results[index] = cached[0]
+                continue
+
+            pending.append(index)
+            payloads.append(payload)
+            keys.append(key)
+
+        if not pending:
+            return results
+
+        batch = {"transactions": payloads}
+        try:
+            response_data = self.client._make_request(
+                method="POST",
+                endpoint="/api/v1/webhook/transaction/batch",
+                payload=batch,
+                extra_headers={HEADER_IDEMPOTENCY_KEY: _idempotency_key(batch)},
+            )
+        except HAVNError as e:
+            if isinstance(e, HAVNAPIError) and e.status_code == HTTP_STATUS_NOT_FOUND:
+                # Backend without batch support: fall back for this and later chunks
+                self._batch_supported = False
+                fallback = self.send_many([transactions[i] for i in pending])
+                for index, result in zip(pending, fallback):
+                    results[index] = result
+                return results
+            # Whole chunk failed: report it per transaction, keep other chunks
+            for index in pending:
+                results[index] = e
+            return results
+
+        self._batch_supported = True
+        items = response_data.get("results") or []
+        for position, index in enumerate(pending):
+            item = items[position] if position < len(items) else None
+            if not isinstance(item, dict):
+                results[index] = HAVNAPIError(
+                    "Missing result for transaction in batch response",
+                    response=response_data,
+                )
+                continue
+
+            result = TransactionResponse.from_dict(item)
+            if result.success:
+                self._sent_cache.set(keys[position], result)
+                results[index] = result
+            else:
+                results[index] = HAVNAPIError(
+                    item.get("error") or item.get("message") or "Transaction failed",
+                    status_code=item.get("status_code"),
+                    response=item,
+                )
+        return results
@@ -1,19 +1,28 @@
 """Voucher webhook handler"""
 
+import dataclasses
+import threading
+import time
 import warnings
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, Tuple
 from datetime import datetime, date
+from ..config import Config
 from ..models.voucher import VoucherValidationPayload, VoucherListFilters
 from ..models.voucher_list import (
     VoucherListResponse,
     VoucherData,
     VoucherListPagination,
 )
-from ..exceptions import HAVNValidationError, HAVNAPIError
+from ..exceptions import HAVNError, HAVNValidationError, HAVNAPIError
+from ..utils.cache import SingleFlight, TTLCache
 from ..constants import (
     HTTP_STATUS_NOT_FOUND,
+    HTTP_STATUS_NOT_MODIFIED,
     HTTP_STATUS_BAD_REQUEST,
     HTTP_STATUS_UNPROCESSABLE_ENTITY,
+    HEADER_ETAG,
+    HEADER_IF_NONE_MATCH,
+    HEADER_CACHE_CONTROL,
 )
 
 
@@ -28,6 +37,47 @@ def _build_voucher_error_message(status_code: int) -> str:
     return "Voucher validation failed"
 
 
+# Statuses meaning "this voucher is invalid" (cached successes are evicted)
+_VOUCHER_REJECTED_STATUSES = frozenset(
+    {HTTP_STATUS_BAD_REQUEST, HTTP_STATUS_NOT_FOUND, HTTP_STATUS_UNPROCESSABLE_ENTITY}
+)
+
+
+def _parse_cache_control(cache_control: Optional[str]) -> Tuple[bool, Optional[int]]:
+    """
+    Parse the directives of a Cache-Control header that affect reuse (DRY helper)
+
+    `private` is ignored: this SDK is the single client of the response.
+
+    Returns:
+        Tuple of (storable, max_age). storable is False only for no-store.
+        max_age is the freshness in seconds, 0 if the response must be
+        revalidated before reuse (no-cache or malformed max-age), or None
+        if not specified.
+    """
+    if not cache_control:
+        return True, None
+    max_age = None
+    no_cache = False
+    for directive in cache_control.lower().split(","):
+        directive = directive.strip()
+        if directive == "no-store":
+            return False, None
+        if directive == "no-cache":
+            no_cache = True
+        elif directive.startswith("max-age="):
+            try:
+                max_age = max(0, int(directive[len("max-age="):]))
+            except ValueError:
+                no_cache = True
+    return True, 0 if no_cache else max_age
+
+
+def _copy_list_response(result: VoucherListResponse) -> VoucherListResponse:
+    """Shallow copy of a cached list response so callers can't mutate the cache"""
+    return dataclasses.replace(result, data=list(result.data))
+
+
 class VoucherWebhook:
     """
     Voucher webhook handler
@@ -55,6 +105,23 @@ class VoucherWebhook:
         """
         self.client = client
 
+        # Opt-in cache for successful validations (disabled when TTL is 0)
+        self._validation_cache = TTLCache(
+            ttl=client.voucher_cache_ttl,
+            stale_ttl=Config.DEFAULT_VOUCHER_CACHE_STALE_TTL,
+        )
+        # Concurrent identical validations share a single backend call
+        self._inflight = SingleFlight()
+
+        # Last voucher list per query: {params_key: (etag, response, fresh_until)}
+        # Entries live until evicted; freshness is driven by the server's headers
+        self._list_cache = TTLCache(ttl=float("inf"), maxsize=128)
+
+    def clear_cache(self) -> None:
+        """Drop all cached voucher validation results and list ETags"""
+        self._validation_cache.clear()
+        self._list_cache.clear()
+
     def validate(
         self,
         voucher_code: str,
@@ -86,6 +153,15 @@ class VoucherWebhook:
         Returns:
             True if voucher is valid
 
+        Note:
+            When the client is created with `voucher_cache_ttl > 0`, successful
+            validations are cached per (voucher_code, amount, currency). Fresh hits
+            skip the network; stale hits return immediately and revalidate in the
+            background. Invalid vouchers are never cached.
+
+            Concurrent calls with identical arguments are coalesced into a single
+            backend request whose result (or error) is shared by all callers.
+
         Raises:
             HAVNValidationError: If payload validation fails
             HAVNAPIError: If voucher is invalid or API request fails
@@ -119,18 +195,71 @@ class VoucherWebhook:
         except ValueError as e:
             raise HAVNValidationError(str(e))
 
+        cache_key = (payload.voucher_code, payload.amount, payload.currency)
+        if self._validation_cache.ttl > 0:
+            cached = self._validation_cache.lookup(cache_key)
+            if cached is not None:
+                _, is_stale = cached
+                if is_stale:
+                    self._refresh_in_background(cache_key, payload.to_dict())
+                return True
+
+        payload_dict = payload.to_dict()
+        self._inflight.do(
+            cache_key, lambda: self._request_validation(cache_key, payload_dict)
+        )
+        return True
+
+    def _request_validation(
+        self, cache_key: Tuple[Any, ...], payload: Dict[str, Any]
+    ) -> None:
+        """
+        Call the validation endpoint and update the validation cache
+
+        Args:
+            cache_key: Cache key for this (voucher_code, amount, currency)
+            payload: Validation payload dictionary
+
+        Raises:
+            HAVNAPIError: If voucher is invalid or API request fails
+        """
         # Make API request (this endpoint returns status code only, no body)
         try:
             self.client._make_request(
                 method="POST",
                 endpoint="/api/v1/webhook/voucher/validate",
-                payload=payload.to_dict(),
+                payload=payload,
             )
-            return True
         except HAVNAPIError as e:
+            if e.status_code in _VOUCHER_REJECTED_STATUSES:
+                # Voucher is no longer valid: drop any cached success. Other
+                # errors (5xx, etc.) keep it, so a backend hiccup during a
+                # background refresh doesn't throw away a good stale entry.
+                self._validation_cache.invalidate(cache_key)
             # Re-raise with clearer message for voucher validation
             error_message = _build_voucher_error_message(e.status_code)
-            raise HAVNAPIError(error_message, status_code=e.status_code)
+            raise HAVNAPIError(error_message, status_code=e.status_code) from e
+
+        if self._validation_cache.ttl > 0:
+            self._validation_cache.set(cache_key, True)
+
+    def _refresh_in_background(
+        self, cache_key: Tuple[Any, ...], payload: Dict[str, Any]
+    ) -> None:
+        """Revalidate a stale cache entry without blocking the caller"""
+        if self._inflight.in_flight(cache_key):
+            return
+
+        def _refresh():
+            try:
+                self._inflight.do(
+                    cache_key, lambda: self._request_validation(cache_key, payload)
+                )
+            except HAVNError:
+                # Invalid vouchers are already evicted; other errors keep stale entry
+                pass
+
+        threading.Thread(target=_refresh, daemon=True).start()
 
     def get_all(
         self,
@@ -162,9 +291,13 @@ class VoucherWebhook:
         """
         Get all vouchers for SaaS company with pagination, filtering, and search
 
-        **Important**: This method always fetches fresh data from HAVN backend.
-        No client-side caching is used. Single source of truth is the backend.
-        Each call makes a new HTTP request to ensure data consistency.
+        **Important**: HAVN backend is the single source of truth. When the
+        backend returns an `ETag`, the next identical query is sent as a
+        conditional GET (`If-None-Match`); a `304 Not Modified` reuses the
+        previously parsed response instead of re-downloading the list. A
+        `Cache-Control: max-age` from the backend is honored (even without an
+        ETag), `no-cache` forces revalidation on every call, and `no-store`
+        disables reuse. Call `clear_cache()` to force a full refetch.
 
         Args:
             page: Page number (default: 1)
@@ -259,17 +392,59 @@ class VoucherWebhook:
         except ValueError as e:
             raise HAVNValidationError(str(e))
 
-        # Make GET request with query params
-        # For GET requests, signature is calculated from empty dict (handled by client)
-        try:
-            response_data = self.client._make_request(
+        params = filters.to_dict()
+        cache_key = tuple(sorted(params.items()))
+
+        # Reuse previous response while server-declared max-age is still valid
+        cached = self._list_cache.lookup(cache_key)
+        cached_entry = cached[0] if cached else None
+        if cached_entry and time.monotonic() < cached_entry[2]:
+            return _copy_list_response(cached_entry[1])
+
+        # Revalidate with the stored ETag so unchanged lists come back as 304
+        extra_headers = (
+            {HEADER_IF_NONE_MATCH: cached_entry[0]}
+            if cached_entry and cached_entry[0]
+            else None
+        )
+
+        def fetch() -> VoucherListResponse:
+            # Make GET request with query params
+            # For GET requests, signature is calculated from empty dict (handled by client)
+            response = self.client._send_request(
                 method="GET",
                 endpoint="/api/v1/webhook/vouchers",
-                payload=filters.to_dict(),  # Pass as query params
+                payload=params,  # Pass as query params
+                extra_headers=extra_headers,
+            )
+
+            storable, max_age = _parse_cache_control(
+                response.headers.get(HEADER_CACHE_CONTROL)
             )
-            return VoucherListResponse.from_dict(response_data)
-        except HAVNAPIError:
-            raise
+            fresh_until = time.monotonic() + (max_age or 0)
+
+            if response.status_code == HTTP_STATUS_NOT_MODIFIED and cached_entry:
+                etag, result, _ = cached_entry
+                if storable:
+                    self._list_cache.set(cache_key, (etag, result, fresh_until))
+                else:
+                    self._list_cache.invalidate(cache_key)
+                return _copy_list_response(result)
+
+            response_data = self.client._handle_response(response)
+            result = VoucherListResponse.from_dict(response_data)
+
+            # Keep it if it can be revalidated (ETag) or reused for a while (max-age)
+            etag = response.headers.get(HEADER_ETAG)
+            if storable and (etag or max_age):
+                self._list_cache.set(cache_key, (etag, result, fresh_until))
+                return _copy_list_response(result)
+
+            self._list_cache.invalidate(cache_key)
+            return result
+
+        # Same 429 handling as _make_request
+        return self.client._retry_rate_limited(fetch)
 
     def get_combined(
         self,
@@ -302,9 +477,11 @@ class VoucherWebhook:
         """
         Get combined vouchers (HAVN + local SaaS company vouchers)
 
-        **Important**: This method always fetches fresh HAVN voucher data from backend.
-        No client-side caching is used. Single source of truth for HAVN vouchers is the backend.
-        Each call makes a new HTTP request to ensure data consistency with backend.
+        **Important**: HAVN voucher data comes from backend via `get_all()`. While a
+        backend `Cache-Control: max-age` window is open, `get_all()` reuses the
+        previous response without a request; after that it revalidates with a
+        conditional GET when an ETag is known. Single source of truth for HAVN
+        vouchers is the backend.
 
         This method combines vouchers from HAVN with local vouchers from
         SaaS company. Only HAVN vouchers are returned from API, local vouchers
@@ -358,8 +535,7 @@ class VoucherWebhook:
             ...         print(f"Local: {voucher.code}")
         """
         # Get HAVN vouchers using existing method
-        # Performance: Always fetch fresh data from backend (no caching)
-        # Single source of truth is the backend - each call makes new HTTP request
+        # Backend stays the single source of truth - get_all() honors max-age, then revalidates via ETag
         filters_dict = {
             "page": page,
             "per_page": per_page,
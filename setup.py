@@ -47,6 +47,9 @@ setup(
     python_requires=">=3.8",
     install_requires=requirements,
     extras_require={
+        "speedups": [
+            "msgspec>=0.18.0",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -43,6 +43,43 @@ class TestHAVNClient:
         )
         assert client.base_url == "https://api.com"
 
+    def test_client_reads_environment(self, monkeypatch):
+        """Test env settings are parsed and runtime env changes are picked up"""
+        monkeypatch.setenv("HAVN_API_KEY", "env_key")
+        monkeypatch.setenv("HAVN_WEBHOOK_SECRET", "env_secret")
+        monkeypatch.setenv("HAVN_TIMEOUT", "12")
+        monkeypatch.setenv("HAVN_MAX_RETRIES", "not-a-number")
+
+        client = HAVNClient()
+        assert client.api_key == "env_key"
+        assert client.timeout == 12
+        assert client.max_retries == 3
+
+        monkeypatch.setenv("HAVN_TIMEOUT", "45")
+        assert HAVNClient().timeout == 45
+
+    def test_client_prewarm(self):
+        """Test prewarm opens a connection in the background and ignores errors"""
+        import requests
+        from unittest.mock import patch
+
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+        with patch.object(
+            client._session, "head", side_effect=requests.exceptions.ConnectionError
+        ) as mock_head:
+            client.prewarm().join(timeout=5)
+
+        mock_head.assert_called_once_with("https://api.havn.com", timeout=30)
+
+    def test_client_pool_maxsize_configurable(self, monkeypatch):
+        """Test pool size comes from kwarg, then HAVN_POOL_MAXSIZE"""
+        monkeypatch.setenv("HAVN_POOL_MAXSIZE", "64")
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+        assert client._session.get_adapter("https://api.havn.com")._pool_maxsize == 64
+
+        client = HAVNClient(api_key="key", webhook_secret="secret", pool_maxsize=8)
+        assert client._session.get_adapter("https://api.havn.com")._pool_maxsize == 8
+
     def test_client_test_mode(self):
         """Test client test mode flag"""
         client = HAVNClient(
@@ -70,3 +107,340 @@ class TestHAVNClient:
         assert "HAVNClient" in repr_str
         assert "https://api.com" in repr_str
         assert "timeout=30" in repr_str
+
+    def test_client_session_uses_pooled_adapter(self):
+        """Test session mounts a single pooled adapter for keep-alive reuse"""
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+        adapter = client._session.get_adapter("https://api.havn.com")
+
+        assert adapter is client._session.get_adapter("http://api.havn.com")
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.total == client.max_retries
+
+
+class TestResponseDecoding:
+    """Test JSON response decoding"""
+
+    def _response(self, status_code, content):
+        import requests
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        return response
+
+    def test_success_body_decoded(self):
+        """Test JSON success body is decoded into a dict"""
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+        response = self._response(200, b'{"success": true, "data": {"id": 1}}')
+
+        assert client._handle_response(response) == {
+            "success": True,
+            "data": {"id": 1},
+        }
+
+    def test_empty_success_body(self):
+        """Test empty success body falls back to default success response"""
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+
+        assert client._handle_response(self._response(200, b"")) == {"success": True}
+
+    def test_error_body_decoded_once(self):
+        """Test error responses decode the body once and keep it on the error"""
+        from unittest.mock import patch
+        from havn.exceptions import HAVNAPIError
+        import havn.client as client_module
+
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+        response = self._response(
+            400, b'{"message": "Invalid amount", "error": "ValidationError"}'
+        )
+
+        with patch.object(
+            client_module,
+            "decode_json_response",
+            wraps=client_module.decode_json_response,
+        ) as mock_decode:
+            with pytest.raises(HAVNAPIError) as exc_info:
+                client._handle_response(response)
+
+        assert mock_decode.call_count == 1
+        assert exc_info.value.status_code == 400
+        assert "[ValidationError] Invalid amount" in str(exc_info.value)
+        assert exc_info.value.response["error"] == "ValidationError"
+
+    def test_non_json_error_body(self):
+        """Test non-JSON error body falls back to default message"""
+        from havn.exceptions import HAVNAPIError
+
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+
+        with pytest.raises(HAVNAPIError) as exc_info:
+            client._handle_response(self._response(502, b"<html>Bad Gateway</html>"))
+
+        assert "API error: 502" in str(exc_info.value)
+        assert exc_info.value.response is None
+
+
+class TestRequestSigning:
+    """Test request body serialization and signing"""
+
+    def test_post_body_is_signed_canonical_json(self):
+        """Test POST body bytes are the canonical bytes the signature covers"""
+        import hashlib
+        import hmac
+        from unittest.mock import patch
+
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+        payload = {"referral_code": "HAVN-MJ-001", "amount": 10000}
+
+        with patch.object(client._session, "request") as mock_request:
+            client._send_request("POST", "/api/v1/webhook/transaction", payload)
+
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs["data"] == b'{"amount":10000,"referral_code":"HAVN-MJ-001"}'
+        expected = hmac.new(b"secret", kwargs["data"], hashlib.sha256).hexdigest()
+        assert kwargs["headers"]["X-Signature"] == expected
+
+    def test_get_signs_empty_payload(self):
+        """Test GET requests sign an empty dict and send payload as params"""
+        import hashlib
+        import hmac
+        from unittest.mock import patch
+
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+
+        with patch.object(client._session, "request") as mock_request:
+            client._send_request("GET", "/api/v1/webhook/vouchers", {"page": "1"})
+
+        kwargs = mock_request.call_args.kwargs
+        assert kwargs["data"] is None
+        assert kwargs["params"] == {"page": "1"}
+        expected = hmac.new(b"secret", b"{}", hashlib.sha256).hexdigest()
+        assert kwargs["headers"]["X-Signature"] == expected
+
+    def test_signature_cache_opt_in(self, monkeypatch):
+        """Test HAVN_SIGNATURE_CACHE_SIZE memoizes signatures per payload bytes"""
+        from unittest.mock import patch
+
+        plain = HAVNClient(api_key="key", webhook_secret="secret")
+        assert not hasattr(plain._sign, "cache_info")
+
+        monkeypatch.setenv("HAVN_SIGNATURE_CACHE_SIZE", "16")
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+
+        with patch.object(client._session, "request") as mock_request:
+            for _ in range(3):
+                client._send_request("POST", "/api/v1/webhook/transaction", {"amount": 1})
+
+        info = client._sign.cache_info()
+        assert (info.hits, info.misses) == (2, 1)
+        assert mock_request.call_args.kwargs["headers"]["X-Signature"] == plain._sign(
+            b'{"amount":1}'
+        )
+
+    def test_static_headers_live_on_session(self):
+        """Test API key/content headers are set once on the session"""
+        from unittest.mock import patch
+
+        client = HAVNClient(api_key="key", webhook_secret="secret", test_mode=True)
+        assert client._session.headers["X-API-Key"] == "key"
+        assert client._session.headers["Content-Type"] == "application/json"
+        assert client._session.headers["Accept"] == "application/json"
+
+        with patch.object(client._session, "request") as mock_request:
+            client._send_request("POST", "/api/v1/webhook/transaction", {"amount": 1})
+
+        headers = mock_request.call_args.kwargs["headers"]
+        assert set(headers) == {"X-Signature", "X-Test-Mode"}
+
+
+class TestRateLimiting:
+    """Test client honors server rate-limit windows"""
+
+    def _response(self, status_code, headers):
+        import requests
+
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = b'{"message": "Too many requests"}'
+        response.headers.update(headers)
+        return response
+
+    def test_429_blocks_next_request_locally(self):
+        """Test 429 with Retry-After raises and short-circuits the next call"""
+        from unittest.mock import patch
+        from havn.exceptions import HAVNRateLimitError
+
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+        limited = self._response(429, {"Retry-After": "30"})
+
+        with patch.object(client._session, "request", return_value=limited) as mock_request:
+            with pytest.raises(HAVNRateLimitError) as exc_info:
+                client._make_request("GET", "/api/v1/webhook/vouchers")
+            assert exc_info.value.retry_after == 30
+
+            with pytest.raises(HAVNRateLimitError):
+                client._make_request("GET", "/api/v1/webhook/vouchers")
+            assert mock_request.call_count == 1
+
+    def test_429_not_in_retry_forcelist(self):
+        """Test urllib3 does not blindly retry 429 responses"""
+        adapter = HAVNClient(api_key="key", webhook_secret="secret")._session.get_adapter(
+            "https://api.havn.com"
+        )
+        assert 429 not in adapter.max_retries.status_forcelist
+
+    def test_retry_on_rate_limit_waits_and_retries(self):
+        """Test opt-in 429 retry sleeps the parsed retry_after, then succeeds"""
+        from unittest.mock import patch
+
+        client = HAVNClient(
+            api_key="key", webhook_secret="secret", retry_on_rate_limit=True
+        )
+        limited = self._response(429, {"Retry-After": "0"})
+        ok = self._response(200, {})
+        ok._content = b'{"success": true}'
+
+        with patch.object(client._session, "request", side_effect=[limited, ok]) as mock_request, \
+                patch("havn.client.time.sleep") as mock_sleep:
+            assert client._make_request("GET", "/api/v1/webhook/vouchers") == {"success": True}
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(0.0)
+
+    def test_retry_on_rate_limit_caps_long_waits(self):
+        """Test waits beyond the cap are slept for the cap, then retried"""
+        from unittest.mock import patch
+
+        client = HAVNClient(
+            api_key="key", webhook_secret="secret", retry_on_rate_limit=True
+        )
+        limited = self._response(429, {"Retry-After": "3600"})
+        ok = self._response(200, {})
+        ok._content = b'{"success": true}'
+
+        with patch.object(client._session, "request", side_effect=[limited, ok]), \
+                patch.object(client._rate_limiter, "acquire"), \
+                patch("havn.client.time.sleep") as mock_sleep:
+            assert client._make_request("GET", "/api/v1/webhook/vouchers") == {"success": True}
+        mock_sleep.assert_called_once_with(60)
+
+    def test_retry_on_rate_limit_without_timing_outlasts_cooldown(self):
+        """Test a bare 429 waits at least the local cooldown before retrying"""
+        from unittest.mock import patch
+
+        client = HAVNClient(
+            api_key="key", webhook_secret="secret", retry_on_rate_limit=True
+        )
+        limited = self._response(429, {})
+        ok = self._response(200, {})
+        ok._content = b'{"success": true}'
+        clock = [1000.0]
+
+        def fake_sleep(seconds):
+            clock[0] += seconds
+
+        with patch.object(client._session, "request", side_effect=[limited, ok]) as mock_request, \
+                patch("havn.utils.rate_limit.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("havn.client.time.sleep", side_effect=fake_sleep) as mock_sleep:
+            assert client._make_request("GET", "/api/v1/webhook/vouchers") == {"success": True}
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(1.0)
+
+
+class TestClientSendMany:
+    """Test client-level concurrent fan-out"""
+
+    def test_results_in_input_order_with_errors_in_place(self):
+        """Test send_many keeps order and returns HAVNError instead of raising"""
+        from havn.exceptions import HAVNAPIError
+
+        client = HAVNClient(api_key="key", webhook_secret="secret", pool_maxsize=2)
+
+        def fail():
+            raise HAVNAPIError("boom", status_code=500)
+
+        results = client.send_many([lambda: 1, fail, lambda: 3], max_workers=8)
+
+        assert results[0] == 1
+        assert isinstance(results[1], HAVNAPIError)
+        assert results[2] == 3
+        assert client.send_many([]) == []
+
+    def test_non_sdk_errors_propagate(self):
+        """Test unexpected exceptions are not swallowed"""
+        client = HAVNClient(api_key="key", webhook_secret="secret")
+
+        def broken():
+            raise RuntimeError("bug")
+
+        with pytest.raises(RuntimeError):
+            client.send_many([broken])
+
+
+class TestAsyncClient:
+    """Test asyncio wrapper client"""
+
+    def test_concurrent_sends_are_awaitable(self):
+        """Test handler methods become coroutines sharing the sync client"""
+        import asyncio
+        from unittest.mock import patch
+        from havn import HAVNAsyncClient
+
+        async def run():
+            async with HAVNAsyncClient(
+                api_key="key", webhook_secret="secret", max_concurrency=48
+            ) as client:
+                assert client.client._session.get_adapter(
+                    "https://api.havn.com"
+                )._pool_maxsize == 48
+
+                with patch.object(client.client, "_make_request") as mock_request:
+                    mock_request.return_value = {
+                        "success": True,
+                        "transaction": {"transaction_id": "txn"},
+                    }
+                    results = await asyncio.gather(
+                        *(
+                            client.transactions.send(
+                                amount=1000 + i,
+                                payment_gateway_transaction_id=f"pg_{i}",
+                                payment_gateway="STRIPE",
+                                customer_email="customer@example.com",
+                                referral_code="HAVN-MJ-001",
+                            )
+                            for i in range(5)
+                        )
+                    )
+                return results, mock_request.call_count
+
+        results, call_count = asyncio.run(run())
+        assert call_count == 5
+        assert all(r.success for r in results)
+
+    def test_pool_maxsize_respects_environment(self, monkeypatch):
+        """Test a larger HAVN_POOL_MAXSIZE is not shrunk to max_concurrency"""
+        import asyncio
+        from havn import HAVNAsyncClient
+
+        monkeypatch.setenv("HAVN_POOL_MAXSIZE", "64")
+
+        async def run():
+            async with HAVNAsyncClient(api_key="key", webhook_secret="secret") as client:
+                return client.client._session.get_adapter(
+                    "https://api.havn.com"
+                )._pool_maxsize
+
+        assert asyncio.run(run()) == 64
+
+    def test_errors_propagate(self):
+        """Test validation errors are raised from the awaited call"""
+        import asyncio
+        from havn import HAVNAsyncClient
+
+        async def run():
+            async with HAVNAsyncClient(api_key="key", webhook_secret="secret") as client:
+                await client.auth.login(email="not-an-email")
+
+        with pytest.raises(HAVNValidationError):
+            asyncio.run(run())
@@ -1,7 +1,12 @@
 """Tests for currency conversion utilities"""
 
-from datetime import datetime
+import asyncio
+import threading
+import time
 from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
 
 from havn.utils import currency as currency_module
 from havn.utils.currency import (
@@ -14,11 +19,10 @@ from havn.utils.currency import (
 def _prime_global_converter() -> CurrencyConverter:
     """Seed the global converter cache with deterministic exchange rates."""
     converter = CurrencyConverter()
-    now = datetime.now()
 
     # Cache USD -> EUR rate (0.9) and USD -> IDR rate (15000)
-    converter._rate_cache["EUR"] = {"rate": Decimal("0.9"), "fetched_at": now}
-    converter._rate_cache["IDR"] = {"rate": Decimal("15000"), "fetched_at": now}
+    converter._rate_cache.set("EUR", Decimal("0.9"))
+    converter._rate_cache.set("IDR", Decimal("15000"))
 
     currency_module._global_converter = converter  # type: ignore[attr-defined]
     return converter
@@ -59,3 +63,155 @@ def test_convert_from_usd_cents_zero_decimal_currency():
 
     assert result["amount"] == 150000  # Rp 150.000
     assert result["currency"] == "IDR"
+
+
+def test_convert_many_to_usd_cents_matches_scalar():
+    converter = _prime_global_converter()
+    amounts = [850, 1, 999, 123456]
+
+    batch = converter.convert_many_to_usd_cents(amounts, "eur")
+
+    assert batch == [
+        converter.convert_to_usd_cents(amount, "EUR")["amount_cents"]
+        for amount in amounts
+    ]
+    assert converter.convert_many_to_usd_cents([150000], "IDR") == [1000]
+
+
+def test_rate_cache_shared_across_instances():
+    first = CurrencyConverter(exchange_rate_api_url="https://rates.test/shared")
+    second = CurrencyConverter(exchange_rate_api_url="https://rates.test/shared")
+    other = CurrencyConverter(exchange_rate_api_url="https://rates.test/other")
+
+    first._rate_cache.set("SGD", Decimal("1.35"))
+
+    assert second.get_exchange_rate("SGD") == Decimal("1.35")
+    assert other._rate_cache.lookup("SGD") is None
+
+
+def test_single_fetch_caches_every_rate():
+    converter = CurrencyConverter(exchange_rate_api_url="https://rates.test/bundle")
+    response = Mock()
+    response.json.return_value = {
+        "rates": {"EUR": 0.9, "IDR": 15000, "JPY": 150, "BAD": -1, "NAN": "x"}
+    }
+
+    with patch.object(currency_module.requests, "get", return_value=response) as get:
+        assert converter.get_exchange_rate("EUR") == Decimal("0.9")
+        assert converter.get_exchange_rate("IDR") == Decimal("15000")
+        assert converter.get_exchange_rate("JPY") == Decimal("150")
+
+    assert get.call_count == 1
+    assert converter._rate_cache.lookup("BAD") is None
+    assert converter._rate_cache.lookup("NAN") is None
+
+
+def test_concurrent_misses_share_one_fetch():
+    converter = CurrencyConverter(exchange_rate_api_url="https://rates.test/flight")
+    release = threading.Event()
+    response = Mock()
+    response.json.return_value = {"rates": {"CHF": 0.88}}
+
+    def slow_get(*args, **kwargs):
+        release.wait(timeout=5)
+        return response
+
+    results = []
+    with patch.object(currency_module.requests, "get", side_effect=slow_get) as get:
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(converter.get_exchange_rate("CHF"))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)  # Let followers block on the in-flight fetch
+        release.set()
+        for thread in threads:
+            thread.join(timeout=5)
+
+    assert get.call_count == 1
+    assert results == [Decimal("0.88")] * 5
+
+
+def test_aget_exchange_rate_matches_sync():
+    converter = CurrencyConverter(exchange_rate_api_url="https://rates.test/async")
+    converter._rate_cache.set("AUD", Decimal("1.5"))
+
+    assert asyncio.run(converter.aget_exchange_rate("AUD")) == Decimal("1.5")
+    assert asyncio.run(converter.aget_exchange_rate("USD", "AUD")) == (
+        converter.get_exchange_rate("USD", "AUD")
+    )
+
+
+def test_cache_file_warms_new_converter(tmp_path):
+    cache_file = str(tmp_path / "fx_cache.json")
+    first = CurrencyConverter(
+        exchange_rate_api_url="https://rates.test/disk-1", cache_file=cache_file
+    )
+    response = Mock()
+    response.json.return_value = {"rates": {"EUR": 0.9, "IDR": 15000}}
+
+    with patch.object(currency_module.requests, "get", return_value=response):
+        assert first.get_exchange_rate("EUR") == Decimal("0.9")
+
+    # A new process-wide cache (different URL) starts from the file alone
+    second = CurrencyConverter(
+        exchange_rate_api_url="https://rates.test/disk-2", cache_file=cache_file
+    )
+    with patch.object(currency_module.requests, "get") as get:
+        assert second.get_exchange_rate("IDR") == Decimal("15000")
+    get.assert_not_called()
+
+
+def test_cache_file_skips_expired_and_corrupt_entries(tmp_path):
+    cache_file = tmp_path / "fx_cache.json"
+    cache_file.write_text(
+        '{"rates": {"EUR": {"rate": "0.9", "fetched_at": 0},'
+        ' "GBP": {"rate": "0.8", "fetched_at": %f}}}' % time.time()
+    )
+
+    converter = CurrencyConverter(
+        exchange_rate_api_url="https://rates.test/disk-3", cache_file=str(cache_file)
+    )
+    assert converter._rate_cache.lookup("EUR") is None
+    assert converter._rate_cache.lookup("GBP") == (Decimal("0.8"), False)
+
+    cache_file.write_text("not json")
+    broken = CurrencyConverter(
+        exchange_rate_api_url="https://rates.test/disk-4", cache_file=str(cache_file)
+    )
+    assert len(broken._rate_cache) == 0
+
+
+def test_unsupported_currency_is_cached_briefly():
+    converter = CurrencyConverter(exchange_rate_api_url="https://rates.test/missing")
+    response = Mock()
+    response.json.return_value = {"rates": {"EUR": 0.9}}
+
+    with patch.object(currency_module.requests, "get", return_value=response) as get:
+        assert converter.get_exchange_rate("XYZ") is None
+        assert converter.get_exchange_rate("XYZ") is None
+    assert get.call_count == 1
+
+
+def test_network_failure_is_not_cached():
+    converter = CurrencyConverter(exchange_rate_api_url="https://rates.test/down")
+    error = currency_module.requests.exceptions.ConnectionError("down")
+
+    with patch.object(currency_module.requests, "get", side_effect=error) as get:
+        assert converter.get_exchange_rate("CAD") is None
+        assert converter.get_exchange_rate("CAD") is None
+    assert get.call_count == 2
+
+
+def test_currency_codes_are_normalized_and_validated():
+    converter = _prime_global_converter()
+
+    assert converter.get_exchange_rate(" eur ") == Decimal("0.9")
+    assert converter.convert_many_to_usd_cents([150000], "idr ") == [1000]
+    with pytest.raises(ValueError, match="Invalid currency code"):
+        converter.get_exchange_rate("EURO")
+    with pytest.raises(ValueError, match="Invalid currency code"):
+        converter.convert_to_usd_cents(100, "E1R")
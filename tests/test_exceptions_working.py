@@ -129,3 +129,24 @@ class TestExceptionsWorking:
         else:
             caught = False
         assert caught == False  # Should not be caught by HAVNAuthError
+
+    def test_exception_fields_are_slotted(self):
+        """Test exception fields live in slots (no instance __dict__ entries)"""
+        error = HAVNAPIError("API failed", status_code=500, response={"error": "x"})
+        assert error.__dict__ == {}
+        assert error.status_code == 500
+
+    def test_exception_pickle_roundtrip(self):
+        """Test slotted exceptions keep their fields across pickling"""
+        import pickle
+
+        error = HAVNRateLimitError("Rate limit exceeded", retry_after=60, limit=100, remaining=0)
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is HAVNRateLimitError
+        assert restored.retry_after == 60
+        assert restored.limit == 100
+        assert str(restored) == str(error)
+
+        api_error = pickle.loads(pickle.dumps(HAVNAPIError("API failed", status_code=409)))
+        assert api_error.status_code == 409
@@ -125,6 +125,26 @@ class TestTransactionPayload:
         with pytest.raises(ValueError, match="referral_code is required"):
             payload.validate()
 
+    def test_normalized_at_construction(self):
+        """Codes are normalized before validate(), so to_dict() is always clean"""
+        payload = TransactionPayload(
+            amount=10000,
+            payment_gateway_transaction_id="txn_norm",
+            payment_gateway=" stripe ",
+            customer_email="customer@example.com",
+            referral_code=" havn-mj-001 ",
+            customer_type="  ",
+            invoice_id="   ",
+        )
+        data = payload.to_dict()
+        assert data["payment_gateway"] == "STRIPE"
+        assert data["referral_code"] == "HAVN-MJ-001"
+        assert "customer_type" not in data
+        assert "invoice_id" not in data
+
+        payload.validate()
+        assert payload.to_dict() == data
+
     def test_invoice_id_trim_and_length(self):
         """invoice_id must be trimmed and <= 100 chars"""
         payload = TransactionPayload(
@@ -185,6 +205,36 @@ class TestUserSyncPayload:
             payload.validate()
 
 
+class TestBulkUserSyncPayload:
+    """Test BulkUserSyncPayload per-user validation"""
+
+    def test_valid_bulk_payload(self):
+        """Test valid users pass, including explicit None optional codes"""
+        from havn.models.user_sync import BulkUserSyncPayload
+
+        payload = BulkUserSyncPayload(
+            users=[
+                {"email": "a@example.com", "name": "A", "upline_code": None},
+                {"email": "b@example.com", "name": "B", "country_code": "ID", "is_owner": True},
+            ]
+        )
+        payload.validate()  # Should not raise
+
+    def test_invalid_user_fields(self):
+        """Test per-user errors report the failing index"""
+        from havn.models.user_sync import BulkUserSyncPayload
+
+        cases = [
+            ({"email": "a@example.com", "name": "   "}, "name cannot be empty"),
+            ({"email": "a@example.com", "name": "A", "country_code": "id"}, "country code must be uppercase"),
+            ({"email": "a@example.com", "name": "A", "is_owner": None}, "is_owner must be boolean"),
+        ]
+        for user, message in cases:
+            payload = BulkUserSyncPayload(users=[{"email": "ok@example.com", "name": "Ok"}, user])
+            with pytest.raises(ValueError, match=f"User at index 1: {message}"):
+                payload.validate()
+
+
 class TestVoucherValidationPayload:
     """Test VoucherValidationPayload model"""
 
@@ -207,3 +257,164 @@ class TestVoucherValidationPayload:
         payload = VoucherValidationPayload(voucher_code="VOUCHER123", amount=-100)
         with pytest.raises(ValueError, match="Amount must be greater than 0"):
             payload.validate()
+
+
+class TestVoucherListFilters:
+    """Test VoucherListFilters query params"""
+
+    def test_to_dict_query_params(self):
+        """Test None dropped, booleans kept, other values stringified"""
+        from havn.models.voucher import VoucherListFilters
+
+        filters = VoucherListFilters(page=2, active=False, min_value=500, search="HAVN")
+        assert filters.to_dict() == {
+            "page": "2",
+            "active": False,
+            "search": "HAVN",
+            "min_value": "500",
+        }
+
+
+    def test_date_filter_formats(self):
+        """Test date filters need real calendar dates (padding optional, as strptime)"""
+        from havn.models.voucher import VoucherListFilters
+
+        VoucherListFilters(
+            start_date_from="2024-01-05",
+            end_date_to="2024-1-5",
+            created_from="2024-01-01",
+            created_to="2024-02-29T23:59:59",
+        ).validate()  # Should not raise
+        VoucherListFilters(created_to="2024-2-9T1:02:03").validate()
+
+        for bad in (
+            {"start_date_from": "2024-13-01"},
+            {"end_date_to": "2024-1-32"},
+            {"created_to": "2023-02-29"},
+            {"created_to": "2024-01-01T25:00:00"},
+        ):
+            with pytest.raises(ValueError, match="must be in YYYY-MM-DD"):
+                VoucherListFilters(**bad).validate()
+
+    def test_canonical_dates_skip_strptime(self):
+        """Test zero-padded dates and datetimes never reach the strptime fallback"""
+        from unittest.mock import patch
+        from havn.models import voucher as voucher_module
+        from havn.models.voucher import VoucherListFilters
+
+        with patch.object(voucher_module, "_strptime_matches") as slow_path:
+            VoucherListFilters(
+                start_date_from="2024-01-05",
+                created_from="2024-01-05",
+                created_to="2024-02-29T23:59:59",
+            ).validate()
+        slow_path.assert_not_called()
+
+
+class TestIsHavnVoucherCode:
+    """Test HAVN voucher code detection"""
+
+    def test_detects_havn_prefix_case_insensitively(self):
+        """Test HAVN prefix detection ignores case"""
+        from havn.models.voucher_list import is_havn_voucher_code
+
+        assert is_havn_voucher_code("HAVN-AQNEO-S08-ABC123") is True
+        assert is_havn_voucher_code("havn-test") is True
+        assert is_havn_voucher_code("LOCAL123") is False
+        assert is_havn_voucher_code("HAVN") is False
+        assert is_havn_voucher_code("") is False
+        assert is_havn_voucher_code(None) is False
+
+
+class TestSlottedResponseModels:
+    """Test response models are slotted"""
+
+    def test_transaction_response_has_no_instance_dict(self):
+        """Test slotted response keeps defaults, equality and pickling"""
+        import pickle
+        from havn.models.transaction import TransactionResponse
+
+        response = TransactionResponse.from_dict(
+            {
+                "success": True,
+                "transaction": {"transaction_id": "txn_1", "amount": 10000},
+                "commissions": [{"associate_id": "A1", "level": 1}],
+            }
+        )
+
+        assert not hasattr(response, "__dict__")
+        assert not hasattr(response.commissions[0], "__dict__")
+        assert response.transaction.currency == "USD"
+        assert pickle.loads(pickle.dumps(response)) == response
+
+    def test_voucher_data_from_dict(self):
+        """Test slotted VoucherData still builds from API dict"""
+        from havn.models.voucher_list import VoucherData
+
+        voucher = VoucherData.from_dict(
+            {
+                "serial": "1",
+                "saas_company_id": 1,
+                "associate_id": "A1",
+                "code": "HAVN-TEST-01",
+                "type": "DISCOUNT_FIXED",
+                "value": 500,
+                "usage_limit": 10,
+                "current_usage": 0,
+                "min_purchase": 0,
+                "unknown_field": "ignored",
+            }
+        )
+
+        assert not hasattr(voucher, "__dict__")
+        assert voucher.is_havn_voucher is True
+        assert voucher.currency == "USD"
+
+    def test_voucher_data_exact_schema_matches_filtered_path(self):
+        """Test the exact-schema fast path builds the same voucher"""
+        from havn.models.voucher_list import VoucherData
+
+        data = {
+            "serial": "1",
+            "saas_company_id": 1,
+            "associate_id": "A1",
+            "code": "LOCAL-01",
+            "type": "DISCOUNT_FIXED",
+            "value": 500,
+            "usage_limit": 10,
+            "current_usage": 0,
+            "min_purchase": 0,
+        }
+
+        fast = VoucherData.from_dict(data)
+        filtered = VoucherData.from_dict(dict(data, unknown_field="ignored"))
+
+        assert fast.is_havn_voucher is False
+        assert fast.raw_response == dict(data, is_havn_voucher=False)
+        assert "is_havn_voucher" not in data
+        assert (fast.code, fast.value, fast.currency) == (
+            filtered.code,
+            filtered.value,
+            filtered.currency,
+        )
+
+    def test_pagination_ignores_unknown_keys(self):
+        """Test new backend pagination keys do not break parsing"""
+        from havn.models.voucher_list import VoucherListPagination
+
+        data = {"page": 1, "limit": 10, "total": 0, "total_pages": 0,
+                "has_prev": False, "has_next": False}
+        assert VoucherListPagination.from_dict(data).total_pages == 0
+        assert VoucherListPagination.from_dict(dict(data, cursor="abc")).page == 1
+
+    def test_from_dict_maps_every_field(self):
+        """Test positional from_dict builders stay aligned with field order"""
+        from dataclasses import fields
+        from havn.models.transaction import CommissionData, TransactionData
+        from havn.models.user_sync import AssociateData, BulkSyncSummary, UserData
+
+        for model in (CommissionData, TransactionData, UserData, AssociateData, BulkSyncSummary):
+            data = {f.name: f"value_{f.name}" for f in fields(model)}
+            instance = model.from_dict(data)
+            for f in fields(model):
+                assert getattr(instance, f.name) == data[f.name], (model.__name__, f.name)
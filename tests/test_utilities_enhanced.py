@@ -4,6 +4,7 @@ Enhanced tests for utility functions
 
 import pytest
 from unittest.mock import patch, Mock
+from urllib3.util.retry import Retry
 from havn.utils.auth import calculate_hmac_signature, build_auth_headers
 from havn.utils.validators import (
     validate_amount,
@@ -197,3 +198,239 @@ class TestValidatorsEnhanced:
         # Invalid type
         with pytest.raises(ValueError, match="Referral code must be a string"):
             validate_referral_code(123)
+
+
+class TestTTLCache:
+    """Tests for the in-memory TTL cache"""
+
+    def test_fresh_stale_and_expired(self):
+        """Entries move from fresh to stale to expired"""
+        from havn.utils.cache import TTLCache
+
+        cache = TTLCache(ttl=10, stale_ttl=20)
+        with patch("havn.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("key", "value")
+        with patch("havn.utils.cache.time.monotonic", return_value=105.0):
+            assert cache.lookup("key") == ("value", False)
+        with patch("havn.utils.cache.time.monotonic", return_value=115.0):
+            assert cache.lookup("key") == ("value", True)
+        with patch("havn.utils.cache.time.monotonic", return_value=131.0):
+            assert cache.lookup("key") is None
+        assert len(cache) == 0
+
+    def test_maxsize_evicts_oldest(self):
+        """Oldest entries are evicted when the cache is full"""
+        from havn.utils.cache import TTLCache
+
+        cache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.lookup("a") is None
+        assert cache.lookup("c") == (3, False)
+
+    def test_set_with_age_and_snapshot(self):
+        """Entries stored with an age expire on their original schedule"""
+        from havn.utils.cache import TTLCache
+
+        cache = TTLCache(ttl=10)
+        with patch("havn.utils.cache.time.monotonic", return_value=100.0):
+            cache.set("old", 1, age=8)
+            cache.set("new", 2)
+        with patch("havn.utils.cache.time.monotonic", return_value=103.0):
+            assert cache.snapshot() == [("new", 2, 3.0)]
+            assert cache.lookup("old") is None
+
+
+class TestSingleFlight:
+    """Tests for concurrent call coalescing"""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Callers arriving while a call is running share its result"""
+        import threading
+        import time
+        from havn.utils.cache import SingleFlight
+
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+        leader.start()
+        started.wait(5)
+
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", slow)))
+            for _ in range(3)
+        ]
+        for t in followers:
+            t.start()
+        time.sleep(0.1)  # Let followers block on the in-flight call
+        release.set()
+        for t in [leader] + followers:
+            t.join(5)
+
+        assert calls == [1]
+        assert results == ["result"] * 4
+        assert not flight.in_flight("k")
+
+    def test_exception_propagates(self):
+        """Errors from the leader are raised to the caller"""
+        from havn.utils.cache import SingleFlight
+
+        flight = SingleFlight()
+
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            flight.do("k", boom)
+        assert not flight.in_flight("k")
+
+
+class TestLazyPackageImports:
+    """Test PEP 562 lazy exports in havn/__init__.py"""
+
+    def test_import_havn_does_not_load_requests(self):
+        """Test bare `import havn` defers the HTTP stack"""
+        import subprocess
+        import sys
+
+        code = "import sys, havn; print('requests' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], text=True)
+        assert output.strip() == "False"
+
+    def test_all_public_names_resolve(self):
+        """Test every name in __all__ is importable from the package"""
+        import havn
+
+        for name in havn.__all__:
+            assert getattr(havn, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names still raise AttributeError"""
+        import havn
+
+        with pytest.raises(AttributeError):
+            havn.DoesNotExist
+
+
+class TestTokenBucket:
+    """Test client-side rate limiter"""
+
+    def test_unlimited_by_default(self):
+        """Test bucket without rate never waits or raises"""
+        from havn.utils.rate_limit import TokenBucket
+
+        bucket = TokenBucket()
+        for _ in range(100):
+            bucket.acquire()
+
+    def test_server_window_exhausted_fails_fast(self):
+        """Test exhausted window raises locally until reset"""
+        from havn.exceptions import HAVNRateLimitError
+        from havn.utils.rate_limit import TokenBucket
+
+        bucket = TokenBucket()
+        bucket.update(remaining=5, reset_after=30)
+        bucket.acquire()
+
+        bucket.update(remaining=0, reset_after=30)
+        with pytest.raises(HAVNRateLimitError) as exc_info:
+            bucket.acquire()
+        assert exc_info.value.retry_after == 30
+
+        bucket.reset()
+        bucket.acquire()
+
+    def test_429_without_timing_blocks_briefly(self):
+        """Test 429 without reset headers applies a short cooldown"""
+        from havn.exceptions import HAVNRateLimitError
+        from havn.utils.rate_limit import TokenBucket
+
+        bucket = TokenBucket()
+        bucket.update(limited=True)
+        with pytest.raises(HAVNRateLimitError):
+            bucket.acquire()
+
+    def test_local_rate_waits_after_burst(self):
+        """Test local pacing sleeps once the burst is spent"""
+        from havn.utils.rate_limit import TokenBucket
+
+        bucket = TokenBucket(rate=10, burst=2)
+        with patch("havn.utils.rate_limit.time.sleep") as mock_sleep:
+            bucket.acquire()
+            bucket.acquire()
+            mock_sleep.assert_not_called()
+            bucket.acquire()
+            assert mock_sleep.call_count == 1
+            assert 0 < mock_sleep.call_args.args[0] <= 0.1
+
+
+class TestHAVNRetry:
+    """Test HAVN urllib3 retry policy"""
+
+    def _response(self, headers, status=503):
+        from urllib3.response import HTTPResponse
+
+        return HTTPResponse(body=b"", headers=headers, status=status, preload_content=False)
+
+    def test_429_never_retried_by_urllib3(self):
+        """Test 429 with Retry-After is left to the rate limiter"""
+        from havn.utils.retry import HAVNRetry
+
+        retry = HAVNRetry(total=3, status_forcelist={500, 502, 503, 504})
+        assert not retry.is_retry("GET", 429, has_retry_after=True)
+        assert retry.is_retry("GET", 503, has_retry_after=True)
+
+    def test_rate_limit_reset_header_honored_and_capped(self):
+        """Test X-RateLimit-Reset drives the wait, capped by max_retry_after"""
+        import time
+        from havn.utils.retry import HAVNRetry
+
+        retry = HAVNRetry(total=3, max_retry_after=5).new(total=2)
+        assert retry.max_retry_after == 5
+
+        reset = str(int(time.time()) + 60)
+        response = self._response({"X-RateLimit-Reset": reset})
+        assert 58 <= retry.get_retry_after(response) <= 60
+
+        with patch("havn.utils.retry.time.sleep") as mock_sleep:
+            assert retry.sleep_for_retry(response) is True
+        mock_sleep.assert_called_once_with(5)
+
+    def test_rate_limit_reset_ignored_for_other_5xx(self):
+        """Test a 500/502/504 carrying X-RateLimit-Reset uses normal backoff"""
+        import time
+        from havn.utils.retry import HAVNRetry
+
+        retry = HAVNRetry(total=3, max_retry_after=30)
+        reset = str(int(time.time()) + 60)
+
+        for status in (500, 502, 504):
+            response = self._response({"X-RateLimit-Reset": reset}, status=status)
+            assert retry.get_retry_after(response) is None
+            with patch("havn.utils.retry.time.sleep") as mock_sleep:
+                assert retry.sleep_for_retry(response) is False
+            mock_sleep.assert_not_called()
+
+    def test_backoff_has_bounded_jitter(self):
+        """Test exponential backoff gets at most 25% jitter"""
+        from urllib3.util.retry import RequestHistory
+        from havn.utils.retry import HAVNRetry
+
+        history = tuple(RequestHistory("GET", "/", None, 503, None) for _ in range(3))
+        retry = HAVNRetry(total=5, backoff_factor=1, history=history)
+        base = Retry(total=5, backoff_factor=1, history=history).get_backoff_time()
+
+        for _ in range(20):
+            assert base <= retry.get_backoff_time() <= base * 1.25
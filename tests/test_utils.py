@@ -15,6 +15,21 @@ from havn.utils.validators import (
 class TestAuthUtils:
     """Test authentication utilities"""
 
+    def test_serialize_payload_matches_backend_canonical_json(self):
+        """Test signing bytes stay identical to json.dumps canonical form"""
+        import json
+        from havn.utils.auth import serialize_payload
+
+        payload = {
+            "description": "Pembayaran café ☕",
+            "amount": 10000,
+            "custom_fields": {"rate": 0.1, "big": 1e16, "flag": True},
+        }
+
+        expected = json.dumps(payload, separators=(",", ":"), sort_keys=True)
+        assert serialize_payload(payload) == expected.encode("utf-8")
+        assert b"\\u00e9" in serialize_payload(payload)
+
     def test_calculate_hmac_signature(self):
         """Test HMAC signature calculation"""
         payload = {"amount": 10000, "referral_code": "HAVN-MJ-001"}
@@ -43,6 +58,30 @@ class TestAuthUtils:
         assert "Content-Type" in headers
         assert headers["Content-Type"] == "application/json"
 
+    def test_hmac_template_matches_direct_signature(self):
+        """Test signing from a pre-keyed template matches plain HMAC"""
+        from havn.utils.auth import create_hmac_template
+
+        payload = {"amount": 10000, "referral_code": "HAVN-MJ-001"}
+        template = create_hmac_template("test_secret")
+
+        expected = calculate_hmac_signature(payload, "test_secret")
+        assert calculate_hmac_signature(payload, "test_secret", template) == expected
+        # Template must not absorb previous messages
+        assert calculate_hmac_signature(payload, "test_secret", template) == expected
+
+    def test_signature_without_template_matches_plain_hmac(self):
+        """Test the cached per-secret template signs like a fresh HMAC"""
+        import hashlib
+        import hmac
+        from havn.utils.auth import serialize_payload
+
+        for payload, secret in (({"a": 1}, "s1"), ({"b": 2}, "s2"), ({"a": 1}, "s1")):
+            expected = hmac.new(
+                secret.encode("utf-8"), serialize_payload(payload), hashlib.sha256
+            ).hexdigest()
+            assert calculate_hmac_signature(payload, secret) == expected
+
 
 class TestValidators:
     """Test validation functions"""
@@ -77,6 +116,13 @@ class TestValidators:
         with pytest.raises(ValueError, match="Invalid email format"):
             validate_email("@example.com")
 
+    def test_validate_email_too_long(self):
+        """Test emails over 254 characters are rejected before the regex"""
+        validate_email("a" * 64 + "@" + "b" * 185 + ".com")  # 254 chars
+
+        with pytest.raises(ValueError, match="Invalid email format"):
+            validate_email("a" * 64 + "@" + "b" * 186 + ".com")
+
     def test_validate_currency_valid(self):
         """Test valid currency validation"""
         validate_currency("USD")
@@ -113,3 +159,4 @@ class TestValidators:
         # Invalid value type
         with pytest.raises(ValueError, match="values must be string, number, or boolean"):
             validate_custom_fields({"key": []})
+
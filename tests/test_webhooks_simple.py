@@ -120,6 +120,222 @@ class TestWebhooksClientAPI:
             assert payload["amount"] == 150000
             assert payload["server_side_conversion"] is True
 
+    def test_transaction_webhook_send_many(self):
+        """Test concurrent batch send keeps input order and returns errors in place"""
+        from havn.exceptions import HAVNAPIError
+
+        def fake_request(method, endpoint, payload, extra_headers=None):
+            if payload["payment_gateway_transaction_id"] == "pg_bad":
+                raise HAVNAPIError("Duplicate transaction", status_code=409)
+            return {
+                "success": True,
+                "message": "Transaction processed",
+                "transaction": {
+                    "transaction_id": payload["payment_gateway_transaction_id"],
+                    "amount": payload["amount"],
+                    "currency": "USD",
+                    "status": "completed",
+                    "customer_type": "NEW_CUSTOMER"
+                },
+                "commissions": []
+            }
+
+        base = {
+            "payment_gateway": "STRIPE",
+            "customer_email": "customer@example.com",
+            "referral_code": "HAVN-MJ-001",
+        }
+        batch = [
+            dict(base, amount=1000, payment_gateway_transaction_id="pg_1"),
+            dict(base, amount=2000, payment_gateway_transaction_id="pg_bad"),
+            dict(base, amount=3000, payment_gateway_transaction_id="pg_3"),
+        ]
+
+        with patch.object(self.client, '_make_request', side_effect=fake_request):
+            results = self.client.transactions.send_many(batch, max_workers=3)
+
+        assert [r.transaction.transaction_id for r in (results[0], results[2])] == ["pg_1", "pg_3"]
+        assert isinstance(results[1], HAVNAPIError)
+        assert self.client.transactions.send_many([]) == []
+
+    def test_transaction_send_many_caps_workers_at_pool_size(self):
+        """send_many never runs more workers than pooled connections"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret", pool_maxsize=2)
+
+        with patch("havn.webhooks.transaction.ThreadPoolExecutor") as mock_executor:
+            mock_executor.return_value.__enter__.return_value.map.return_value = []
+            client.transactions.send_many([{}] * 10, max_workers=8)
+
+        mock_executor.assert_called_once_with(max_workers=2)
+
+    def test_transaction_send_dedupes_by_idempotency_key(self):
+        """Test repeated send of the same transaction is answered from cache"""
+        kwargs = {
+            "amount": 10000,
+            "payment_gateway_transaction_id": "stripe_dup_1",
+            "payment_gateway": "STRIPE",
+            "customer_email": "customer@example.com",
+            "referral_code": "HAVN-MJ-001",
+        }
+
+        with patch.object(self.client, '_make_request') as mock_request:
+            mock_request.return_value = {
+                "success": True,
+                "message": "Transaction processed",
+                "transaction": {"transaction_id": "txn_1", "amount": 10000},
+                "commissions": []
+            }
+
+            first = self.client.transactions.send(**kwargs)
+            second = self.client.transactions.send(**kwargs)
+            assert second is first
+            assert mock_request.call_count == 1
+
+            headers = mock_request.call_args.kwargs["extra_headers"]
+            assert len(headers["Idempotency-Key"]) == 32
+
+            # Different payload -> different key -> new request
+            self.client.transactions.send(**dict(kwargs, amount=20000))
+            assert mock_request.call_count == 2
+            other_headers = mock_request.call_args.kwargs["extra_headers"]
+            assert other_headers["Idempotency-Key"] != headers["Idempotency-Key"]
+
+            self.client.transactions.clear_cache()
+            self.client.transactions.send(**kwargs)
+            assert mock_request.call_count == 3
+
+    def test_transaction_send_does_not_cache_errors(self):
+        """Test failed sends are retried against the API"""
+        from havn.exceptions import HAVNAPIError
+
+        kwargs = {
+            "amount": 10000,
+            "payment_gateway_transaction_id": "stripe_err_1",
+            "payment_gateway": "STRIPE",
+            "customer_email": "customer@example.com",
+            "referral_code": "HAVN-MJ-001",
+        }
+
+        with patch.object(self.client, '_make_request') as mock_request:
+            mock_request.side_effect = HAVNAPIError("Server error", status_code=500)
+            with pytest.raises(HAVNAPIError):
+                self.client.transactions.send(**kwargs)
+            with pytest.raises(HAVNAPIError):
+                self.client.transactions.send(**kwargs)
+            assert mock_request.call_count == 2
+
+    def test_transaction_send_batch_single_request_per_chunk(self):
+        """Test send_batch POSTs chunks and maps per-item results in order"""
+        from havn.exceptions import HAVNAPIError, HAVNValidationError
+
+        def fake_request(method, endpoint, payload, extra_headers=None):
+            assert endpoint == "/api/v1/webhook/transaction/batch"
+            return {"results": [
+                {"success": False, "error": "Duplicate transaction"}
+                if tx["payment_gateway_transaction_id"] == "pg_dup"
+                else {
+                    "success": True,
+                    "transaction": {"transaction_id": tx["payment_gateway_transaction_id"]},
+                }
+                for tx in payload["transactions"]
+            ]}
+
+        base = {
+            "payment_gateway": "STRIPE",
+            "customer_email": "customer@example.com",
+            "referral_code": "HAVN-MJ-001",
+        }
+        batch = [
+            dict(base, amount=1000, payment_gateway_transaction_id="pg_1"),
+            dict(base, amount=2000, payment_gateway_transaction_id="pg_dup"),
+            dict(base, amount=3000, payment_gateway_transaction_id="pg_3"),
+            dict(base, amount=4000, payment_gateway_transaction_id="pg_4", payment_gateway=""),
+        ]
+
+        with patch.object(self.client, '_make_request', side_effect=fake_request) as mock_request:
+            results = self.client.transactions.send_batch(batch, chunk_size=2)
+            assert mock_request.call_count == 2
+
+            assert results[0].transaction.transaction_id == "pg_1"
+            assert isinstance(results[1], HAVNAPIError)
+            assert results[2].transaction.transaction_id == "pg_3"
+            assert isinstance(results[3], HAVNValidationError)
+
+            # Successful items are deduped by idempotency key
+            again = self.client.transactions.send_batch(batch[:1])
+            assert again[0] is results[0]
+            assert mock_request.call_count == 2
+
+        with pytest.raises(ValueError):
+            self.client.transactions.send_batch(batch, chunk_size=0)
+
+    def test_transaction_send_batch_falls_back_without_endpoint(self):
+        """Test 404 from the batch endpoint switches to per-transaction sends"""
+        from havn.exceptions import HAVNAPIError
+
+        endpoints = []
+
+        def fake_request(method, endpoint, payload, extra_headers=None):
+            endpoints.append(endpoint)
+            if endpoint.endswith("/batch"):
+                raise HAVNAPIError("Not found", status_code=404)
+            return {
+                "success": True,
+                "transaction": {"transaction_id": payload["payment_gateway_transaction_id"]},
+            }
+
+        base = {
+            "payment_gateway": "STRIPE",
+            "customer_email": "customer@example.com",
+            "referral_code": "HAVN-MJ-001",
+        }
+        batch = [
+            dict(base, amount=1000 * i, payment_gateway_transaction_id=f"pg_{i}")
+            for i in range(1, 5)
+        ]
+
+        with patch.object(self.client, '_make_request', side_effect=fake_request):
+            results = self.client.transactions.send_batch(batch, chunk_size=2)
+
+        assert [r.transaction.transaction_id for r in results] == ["pg_1", "pg_2", "pg_3", "pg_4"]
+        # Batch endpoint probed once, then remembered as unsupported
+        assert endpoints.count("/api/v1/webhook/transaction/batch") == 1
+        assert endpoints.count("/api/v1/webhook/transaction") == 4
+
+    def test_transaction_send_batch_chunk_failure_keeps_other_chunks(self):
+        """Test a failed chunk is reported per item instead of raising"""
+        from havn.exceptions import HAVNNetworkError
+
+        calls = []
+
+        def fake_request(method, endpoint, payload, extra_headers=None):
+            calls.append(payload)
+            if len(calls) == 2:
+                raise HAVNNetworkError("Connection reset")
+            return {"results": [
+                {"success": True, "transaction": {"transaction_id": tx["payment_gateway_transaction_id"]}}
+                for tx in payload["transactions"]
+            ]}
+
+        base = {
+            "payment_gateway": "STRIPE",
+            "customer_email": "customer@example.com",
+            "referral_code": "HAVN-MJ-001",
+        }
+        batch = [
+            dict(base, amount=1000 * i, payment_gateway_transaction_id=f"pgx_{i}")
+            for i in range(1, 6)
+        ]
+
+        with patch.object(self.client, '_make_request', side_effect=fake_request):
+            results = self.client.transactions.send_batch(batch, chunk_size=2)
+
+        assert len(results) == 5
+        assert [r.transaction.transaction_id for r in results[:2]] == ["pgx_1", "pgx_2"]
+        assert isinstance(results[2], HAVNNetworkError)
+        assert results[3] is results[2]
+        assert results[4].transaction.transaction_id == "pgx_5"
+
     def test_user_sync_webhook_single(self):
         """Test user sync webhook single user"""
         with patch.object(self.client, '_make_request') as mock_request:
@@ -216,3 +432,278 @@ class TestWebhooksClientAPI:
             result = self.client.auth.login("user@example.com")
 
             assert result == "https://havn.com/login?token=temp_token_123"
+
+
+class TestVoucherValidationCache:
+    """Test opt-in voucher validation caching"""
+
+    def test_cache_disabled_by_default(self):
+        """Every validation hits the backend when caching is off"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        with patch.object(client, '_make_request', return_value={}) as mock_request:
+            client.vouchers.validate("HAVN-ABC-001", amount=10000, currency="USD")
+            client.vouchers.validate("HAVN-ABC-001", amount=10000, currency="USD")
+
+        assert mock_request.call_count == 2
+
+    def test_cache_hit_skips_backend(self):
+        """Fresh cached validations do not hit the backend"""
+        client = HAVNClient(
+            api_key="test_key", webhook_secret="test_secret", voucher_cache_ttl=30
+        )
+        with patch.object(client, '_make_request', return_value={}) as mock_request:
+            assert client.vouchers.validate("HAVN-ABC-001", amount=10000) is True
+            assert client.vouchers.validate("HAVN-ABC-001", amount=10000) is True
+            client.vouchers.validate("HAVN-ABC-001", amount=20000)
+
+        assert mock_request.call_count == 2
+
+        client.vouchers.clear_cache()
+        with patch.object(client, '_make_request', return_value={}) as mock_request:
+            client.vouchers.validate("HAVN-ABC-001", amount=10000)
+        assert mock_request.call_count == 1
+
+    def test_invalid_voucher_not_cached(self):
+        """Rejected vouchers are never served from cache"""
+        from havn.exceptions import HAVNAPIError
+
+        client = HAVNClient(
+            api_key="test_key", webhook_secret="test_secret", voucher_cache_ttl=30
+        )
+        error = HAVNAPIError("bad", status_code=404)
+        with patch.object(client, '_make_request', side_effect=error) as mock_request:
+            for _ in range(2):
+                with pytest.raises(HAVNAPIError, match="Voucher not found"):
+                    client.vouchers.validate("HAVN-GONE-001")
+
+        assert mock_request.call_count == 2
+
+    def _stale_client(self):
+        """Client with one cached validation that is now stale, plus its clock"""
+        client = HAVNClient(
+            api_key="test_key", webhook_secret="test_secret", voucher_cache_ttl=30
+        )
+        clock = [100.0]
+        patcher = patch("havn.utils.cache.time.monotonic", side_effect=lambda: clock[0])
+        patcher.start()
+        self._patchers = [patcher]
+        with patch.object(client, '_make_request', return_value={}):
+            client.vouchers.validate("HAVN-ABC-001", amount=10000)
+        clock[0] += 31  # Past ttl, inside the stale window
+        return client
+
+    def _refresh_once(self, client, side_effect):
+        """Stale validate with the background refresh run synchronously"""
+
+        class InlineThread:
+            def __init__(self, target, daemon=None):
+                self._target = target
+
+            def start(self):
+                self._target()
+
+        with patch.object(client, '_make_request', side_effect=side_effect) as mock_request, \
+                patch("havn.webhooks.voucher.threading.Thread", InlineThread):
+            assert client.vouchers.validate("HAVN-ABC-001", amount=10000) is True
+        return mock_request
+
+    def teardown_method(self):
+        for patcher in getattr(self, "_patchers", []):
+            patcher.stop()
+        self._patchers = []
+
+    def test_stale_hit_refreshes_once(self):
+        """A stale hit returns True and triggers exactly one refresh"""
+        client = self._stale_client()
+        mock_request = self._refresh_once(client, [{}])
+
+        assert mock_request.call_count == 1
+        assert client.vouchers._validation_cache.lookup(
+            ("HAVN-ABC-001", 10000, None)
+        ) == (True, False)
+
+    def test_refresh_404_evicts_entry(self):
+        """A 404 on refresh evicts the cached success"""
+        from havn.exceptions import HAVNAPIError
+
+        client = self._stale_client()
+        self._refresh_once(client, HAVNAPIError("gone", status_code=404))
+
+        assert client.vouchers._validation_cache.lookup(
+            ("HAVN-ABC-001", 10000, None)
+        ) is None
+
+    def test_refresh_5xx_keeps_stale_entry(self):
+        """A backend error on refresh keeps the stale entry"""
+        from havn.exceptions import HAVNAPIError
+
+        client = self._stale_client()
+        self._refresh_once(client, HAVNAPIError("boom", status_code=501))
+
+        assert client.vouchers._validation_cache.lookup(
+            ("HAVN-ABC-001", 10000, None)
+        ) == (True, True)
+
+    def test_error_is_chained(self):
+        """The friendlier voucher error keeps the original as its cause"""
+        from havn.exceptions import HAVNAPIError
+
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        error = HAVNAPIError("bad", status_code=400)
+        with patch.object(client, '_make_request', side_effect=error):
+            with pytest.raises(HAVNAPIError) as exc_info:
+                client.vouchers.validate("HAVN-GONE-001")
+        assert exc_info.value.__cause__ is error
+
+
+class TestVoucherListConditionalGet:
+    """Test ETag revalidation for voucher list"""
+
+    def _response(self, status_code, body=None, headers=None):
+        import json
+        import requests
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers.update(headers or {})
+        response._content = json.dumps(body).encode() if body is not None else b""
+        return response
+
+    def test_etag_revalidation_reuses_previous_response(self):
+        """A 304 returns the previously parsed list and sends If-None-Match"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        body = {"success": True, "message": "ok", "data": [], "pagination": None}
+        responses = [
+            self._response(200, body, {"ETag": '"v1"'}),
+            self._response(304),
+        ]
+
+        with patch.object(client, '_send_request', side_effect=responses) as mock_send:
+            first = client.vouchers.get_all(page=1)
+            second = client.vouchers.get_all(page=1)
+
+        assert second == first
+        assert mock_send.call_args_list[0].kwargs["extra_headers"] is None
+        assert mock_send.call_args_list[1].kwargs["extra_headers"] == {
+            "If-None-Match": '"v1"'
+        }
+
+    def test_cached_response_is_not_shared(self):
+        """Mutating a returned list does not affect later cached results"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        body = {"success": True, "message": "ok", "data": [], "pagination": None}
+        headers = {"ETag": '"v1"', "Cache-Control": "max-age=60"}
+
+        with patch.object(
+            client, '_send_request', return_value=self._response(200, body, headers)
+        ):
+            first = client.vouchers.get_all(page=1)
+            first.data.append("mutated")
+            second = client.vouchers.get_all(page=1)
+
+        assert second is not first
+        assert second.data == []
+
+    def test_rate_limited_list_uses_client_retry(self):
+        """get_all goes through the same 429 retry path as _make_request"""
+        client = HAVNClient(
+            api_key="test_key", webhook_secret="test_secret", retry_on_rate_limit=True
+        )
+        body = {"success": True, "message": "ok", "data": []}
+        responses = [
+            self._response(429, {"error": "Too many"}, {"Retry-After": "0"}),
+            self._response(200, body),
+        ]
+
+        with patch.object(client, '_send_request', side_effect=responses) as mock_send, \
+                patch("havn.client.time.sleep") as mock_sleep:
+            result = client.vouchers.get_all(page=1)
+
+        assert result.success is True
+        assert mock_send.call_count == 2
+        mock_sleep.assert_called_once_with(0.0)
+
+    def test_max_age_skips_request(self):
+        """Responses within Cache-Control max-age are reused without a request"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        body = {"success": True, "message": "ok", "data": []}
+        headers = {"ETag": '"v1"', "Cache-Control": "max-age=60"}
+
+        with patch.object(
+            client, '_send_request', return_value=self._response(200, body, headers)
+        ) as mock_send:
+            first = client.vouchers.get_all(page=1)
+            second = client.vouchers.get_all(page=1)
+            client.vouchers.get_all(page=2)
+
+        assert second == first
+        assert mock_send.call_count == 2
+
+    def test_no_store_disables_reuse(self):
+        """no-store responses are never reused"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        body = {"success": True, "message": "ok", "data": []}
+        headers = {"ETag": '"v1"', "Cache-Control": "no-store"}
+
+        with patch.object(
+            client, '_send_request', return_value=self._response(200, body, headers)
+        ) as mock_send:
+            client.vouchers.get_all(page=1)
+            client.vouchers.get_all(page=1)
+
+        assert mock_send.call_args_list[1].kwargs["extra_headers"] is None
+
+    def test_no_cache_with_etag_revalidates(self):
+        """no-cache keeps the ETag but revalidates on every call"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        body = {"success": True, "message": "ok", "data": []}
+        headers = {"ETag": '"v1"', "Cache-Control": "no-cache, max-age=60"}
+        responses = [
+            self._response(200, body, headers),
+            self._response(304, headers=headers),
+        ]
+
+        with patch.object(client, '_send_request', side_effect=responses) as mock_send:
+            client.vouchers.get_all(page=1)
+            client.vouchers.get_all(page=1)
+
+        assert mock_send.call_count == 2
+        assert mock_send.call_args_list[1].kwargs["extra_headers"] == {
+            "If-None-Match": '"v1"'
+        }
+
+    def test_private_is_ignored(self):
+        """private does not prevent reuse within max-age"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        body = {"success": True, "message": "ok", "data": []}
+        headers = {"ETag": '"v1"', "Cache-Control": "private, max-age=60"}
+
+        with patch.object(
+            client, '_send_request', return_value=self._response(200, body, headers)
+        ) as mock_send:
+            client.vouchers.get_all(page=1)
+            client.vouchers.get_all(page=1)
+
+        assert mock_send.call_count == 1
+
+    def test_max_age_without_etag(self):
+        """max-age alone is reused for its window, then refetched unconditionally"""
+        client = HAVNClient(api_key="test_key", webhook_secret="test_secret")
+        body = {"success": True, "message": "ok", "data": []}
+        headers = {"Cache-Control": "max-age=60"}
+        clock = [100.0]
+
+        with patch.object(
+            client, '_send_request', return_value=self._response(200, body, headers)
+        ) as mock_send, patch(
+            "havn.webhooks.voucher.time.monotonic", side_effect=lambda: clock[0]
+        ):
+            client.vouchers.get_all(page=1)
+            client.vouchers.get_all(page=1)
+            assert mock_send.call_count == 1
+
+            clock[0] += 61
+            client.vouchers.get_all(page=1)
+
+        assert mock_send.call_count == 2
+        assert mock_send.call_args_list[1].kwargs["extra_headers"] is None